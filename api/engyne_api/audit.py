@@ -6,6 +6,7 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from engyne_api.db.models import AuditLog, User
+from engyne_api.db.session import SessionLocal
 from engyne_api.settings import Settings
 
 
@@ -34,3 +35,19 @@ def log_audit(
         db.commit()
     except Exception:
         db.rollback()
+
+
+def log_audit_deferred(
+    settings: Settings,
+    action: str,
+    user_id: str | None = None,
+    slot_id: str | None = None,
+    details: dict[str, Any] | None = None,
+) -> None:
+    """log_audit on a session of its own, for BackgroundTasks that run after the request session is closed."""
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id) if user_id else None
+        log_audit(db, settings, action=action, user=user, slot_id=slot_id, details=details)
+    finally:
+        db.close()
@@ -35,3 +35,8 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="user not found")
     return user
 
+
+def require_admin(user: User = Depends(get_current_user)) -> User:
+    if user.role != "admin":
+        raise HTTPException(status_code=403, detail="admin role required")
+    return user
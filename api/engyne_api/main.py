@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from engyne_api.db.base import Base
 from engyne_api.db.engine import engine
 from engyne_api.db import models as _models  # noqa: F401
+from engyne_api.http_client import close_http_session
 from engyne_api.analytics_service import start_background_analytics, stop_background_analytics
 from engyne_api.manager_service import start_background_manager, stop_background_manager
 from engyne_api.observability import init_observability
@@ -27,7 +30,7 @@ from core.slot_fs import ensure_slots_root
 def create_app() -> FastAPI:
     settings = get_settings()
 
-    app = FastAPI(title="ENGYNE API", version="0.1.0")
+    app = FastAPI(title="ENGYNE API", version="0.1.0", default_response_class=ORJSONResponse)
     init_observability(app, settings)
 
     app.add_middleware(
@@ -38,6 +41,7 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
 
     @app.get("/healthz")
     def healthz() -> dict:
@@ -68,6 +72,10 @@ def create_app() -> FastAPI:
         stop_background_manager()
         stop_background_analytics()
 
+    @app.on_event("shutdown")
+    async def _close_http() -> None:
+        await close_http_session()
+
     return app
 
 
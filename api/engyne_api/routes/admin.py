@@ -6,9 +6,9 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from core.slot_fs import ensure_slots_root, slot_paths
+from core.slot_fs import slot_paths
 from engyne_api.audit import log_audit
-from engyne_api.auth.deps import get_current_user
+from engyne_api.auth.deps import require_admin
 from engyne_api.db.deps import get_db
 from engyne_api.db.models import User
 from engyne_api.email import send_invite_email
@@ -42,13 +42,10 @@ class ClientSummary(BaseModel):
 def invite_user(
     payload: InviteRequest,
     background_tasks: BackgroundTasks,
-    user: User = Depends(get_current_user),
+    user: User = Depends(require_admin),
     db: Session = Depends(get_db),
     settings: Settings = Depends(get_settings),
 ) -> InviteResponse:
-    if user.role != "admin":
-        raise HTTPException(status_code=403, detail="admin role required")
-
     email = payload.email.strip().lower()
     if not email or "@" not in email or "." not in email:
         raise HTTPException(status_code=400, detail="invalid email")
@@ -57,7 +54,6 @@ def invite_user(
     if not slots:
         raise HTTPException(status_code=400, detail="at least one slot is required")
 
-    ensure_slots_root(settings.slots_root_path)
     valid_slots: list[str] = []
     missing: list[str] = []
     for slot_id in slots:
@@ -125,12 +121,9 @@ def invite_user(
 
 @router.get("/clients", response_model=list[ClientSummary])
 def list_clients(
-    user: User = Depends(get_current_user),
+    user: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ) -> list[ClientSummary]:
-    if user.role != "admin":
-        raise HTTPException(status_code=403, detail="admin role required")
-
     rows = db.query(User).order_by(User.created_at.desc()).all()
     return [
         ClientSummary(
@@ -9,7 +9,7 @@ import requests
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
-from core.slot_fs import SlotSnapshot, ensure_slots_root, list_slot_paths, read_slot_snapshot
+from core.slot_fs import SlotSnapshot, list_slot_paths, read_slot_snapshot
 from engyne_api.auth.deps import get_current_user
 from engyne_api.db.models import User
 from engyne_api.settings import Settings, get_settings
@@ -105,7 +105,6 @@ def get_cluster_slots(
 ) -> list[ClusterSlotSummary]:
     results: list[ClusterSlotSummary] = []
 
-    ensure_slots_root(settings.slots_root_path)
     local_snapshots = [read_slot_snapshot(p) for p in list_slot_paths(settings.slots_root_path)]
     results.extend([_summary_from_snapshot(s, settings.node_id) for s in local_snapshots])
 
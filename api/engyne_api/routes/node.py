@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from core.slot_fs import SlotSnapshot, ensure_slots_root, list_slot_paths, read_slot_snapshot
+from core.slot_fs import SlotSnapshot, list_slot_paths, read_slot_snapshot
 from engyne_api.db.deps import get_db
 from engyne_api.db.models import NodeRegistry
 from engyne_api.settings import Settings, get_settings
@@ -99,7 +99,6 @@ def get_node_info(
     db: Session = Depends(get_db),
 ) -> NodeInfo:
     _require_node_secret(request, settings)
-    ensure_slots_root(settings.slots_root_path)
     count = len(list_slot_paths(settings.slots_root_path))
     _update_node_registry(db, settings, count)
     return NodeInfo(node_id=settings.node_id, slots_count=count)
@@ -112,7 +111,6 @@ def get_slot_snapshot(
     db: Session = Depends(get_db),
 ) -> NodeSnapshotResponse:
     _require_node_secret(request, settings)
-    ensure_slots_root(settings.slots_root_path)
     snapshots = [read_slot_snapshot(p) for p in list_slot_paths(settings.slots_root_path)]
     _update_node_registry(db, settings, len(snapshots))
     return NodeSnapshotResponse(
@@ -13,7 +13,7 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from engyne_api.audit import log_audit
-from core.slot_fs import ensure_slots_root, slot_paths
+from core.slot_fs import slot_paths
 from engyne_api.auth.deps import get_current_user
 from engyne_api.db.deps import get_db
 from engyne_api.db.models import User
@@ -326,7 +326,6 @@ def start_remote_login(
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> RemoteLoginStartResponse:
-    ensure_slots_root(settings.slots_root_path)
     try:
         paths = slot_paths(settings.slots_root_path, slot_id)
     except ValueError:
@@ -1,45 +1,59 @@
 from __future__ import annotations
 
-import psutil
+import asyncio
+import copy
+import functools
+import hashlib
+import os
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+from typing import Callable
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse, Response
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from sqlalchemy.orm import Session
 
 from engyne_api.audit import log_audit
-from engyne_api.auth.deps import get_current_user
+from engyne_api.auth.deps import get_current_user, require_admin
 from engyne_api.db.deps import get_db
 from engyne_api.db.models import User
 from engyne_api.manager_service import get_manager
 from engyne_api.settings import Settings, get_settings
 from core.lead_rules import (
+    compile_terms,
     country_matches,
-    extract_member_since_text,
     extract_structured_fields,
-    extract_time_text,
+    extract_timing_fields,
     keywords_match,
+    normalize_country_value,
     normalize_keyword_text,
     normalize_list as normalize_list_rules,
     normalize_method,
-    parse_age_hours,
-    parse_member_months,
-    text_contains_any,
+    prepare_keywords,
 )
 from core.quality import quality_mapping
 from core.slot_fs import (
+    SlotPaths,
     SlotSnapshot,
-    ensure_slots_root,
     list_slot_paths,
     read_leads_tail,
     read_slot_config,
     read_slot_snapshot,
+    read_slot_snapshot_bulk,
     slot_paths,
     write_slot_config,
 )
 
 router = APIRouter(prefix="/slots", tags=["slots"])
 
+_pid_exists: Callable[[int], bool] | None = None
+
+_SNAPSHOT_READ_WORKERS = 32
+
 
 class SlotSummary(BaseModel):
     slot_id: str
@@ -66,28 +80,29 @@ class SlotActionResponse(BaseModel):
     status: str
 
 
-class LeadItem(BaseModel):
-    lead_id: str | None
-    observed_at: str | None
-    title: str | None
-    country: str | None
-    contact: str | None
-    email: str | None
-    phone: str | None
-    verified: bool | None
-    clicked: bool | None
-    verification_source: str | None
+@dataclass(slots=True)
+class LeadItem:
+    # Plain slotted dataclass: up to 500 of these are built per leads request.
+    lead_id: str | None = None
+    observed_at: str | None = None
+    title: str | None = None
+    country: str | None = None
+    contact: str | None = None
+    email: str | None = None
+    phone: str | None = None
+    verified: bool | None = None
+    clicked: bool | None = None
+    verification_source: str | None = None
 
 
-class SlotConfigUpdate(BaseModel):
+class SlotConfigUpdateLimited(BaseModel):
+    """Fields a client may change; anything else in the body is ignored."""
+
     quality_level: int | None = Field(default=None, ge=0, le=100)
     dry_run: bool | None = None
-    auto_buy: bool | None = None
-    max_leads_per_cycle: int | None = Field(default=None, ge=1, le=1000)
     max_clicks_per_cycle: int | None = Field(default=None, ge=0, le=100)
     max_run_minutes: int | None = Field(default=None, ge=1, le=1440)
     allowed_countries: list[str] | None = None
-    blocked_countries: list[str] | None = None
     keywords: list[str] | None = None
     keywords_exclude: list[str] | None = None
     required_contact_methods: list[str] | None = None
@@ -96,6 +111,32 @@ class SlotConfigUpdate(BaseModel):
     channels: dict[str, bool] | None = None
 
 
+class SlotConfigUpdateAdmin(SlotConfigUpdateLimited):
+    auto_buy: bool | None = None
+    max_leads_per_cycle: int | None = Field(default=None, ge=1, le=1000)
+    blocked_countries: list[str] | None = None
+
+
+_LIMITED_UPDATE_ADAPTER = TypeAdapter(SlotConfigUpdateLimited)
+_ADMIN_UPDATE_ADAPTER = TypeAdapter(SlotConfigUpdateAdmin)
+# The body is parsed by _parse_config_update, so FastAPI cannot infer it; document it here.
+_CONFIG_UPDATE_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "anyOf": [
+                        SlotConfigUpdateLimited.model_json_schema(),
+                        SlotConfigUpdateAdmin.model_json_schema(),
+                    ]
+                }
+            }
+        },
+    }
+}
+
+
 class SlotConfigReplace(BaseModel):
     config: dict
 
@@ -157,18 +198,20 @@ class SlotConfigPreviewResponse(BaseModel):
 def _normalize_list(values: list[str] | None) -> list[str] | None:
     if values is None:
         return None
-    cleaned = [str(v).strip().lower() for v in values if str(v).strip()]
-    return cleaned
+    # dict.fromkeys dedupes while keeping the order the client sent.
+    return list(dict.fromkeys(s for v in values if (s := str(v).strip().lower())))
+
+
+_CHANNEL_NAMES: frozenset[str] = frozenset({"whatsapp", "telegram", "email", "sheets", "push", "slack"})
 
 
 def _normalize_channels(channels: dict[str, bool] | None) -> dict[str, bool] | None:
     if channels is None:
         return None
-    allowed = {"whatsapp", "telegram", "email", "sheets", "push", "slack"}
     cleaned: dict[str, bool] = {}
     for key, value in channels.items():
         name = str(key).strip().lower()
-        if name in allowed:
+        if name in _CHANNEL_NAMES:
             cleaned[name] = bool(value)
     return cleaned
 
@@ -232,12 +275,69 @@ def _build_preview_config(base: dict, override: dict | None, user: User) -> dict
     return config
 
 
-def _evaluate_lead_preview(record: dict, config: dict) -> tuple[SlotConfigPreviewDecision, dict]:
+@dataclass(frozen=True, slots=True)
+class PreviewPolicy:
+    max_age_hours: int | None
+    min_member_months: int | None
+    allowed_countries: list[str]
+    blocked_countries: list[str]
+    allowed_country_set: frozenset[str]
+    blocked_country_set: frozenset[str]
+    keywords: list[str]
+    keywords_exclude: tuple[str, ...]
+    keyword_rx: re.Pattern[str] | None
+    exclude_rx: re.Pattern[str] | None
+    required_methods: list[str]
+    keyword_fuzzy: bool
+    keyword_fuzzy_threshold: float
+
+
+def _plain_country_terms(terms: list[str]) -> frozenset[str]:
+    # Only terms that are already normalized can be matched by plain equality.
+    return frozenset(t for t in terms if normalize_country_value(t) == t)
+
+
+def _build_preview_policy(config: dict) -> PreviewPolicy:
+    policy = quality_mapping(int(config.get("quality_level", 0)))
+    allowed_countries = config.get("allowed_countries") or []
+    blocked_countries = config.get("blocked_countries") or []
+    try:
+        keyword_fuzzy_threshold = float(config.get("keyword_fuzzy_threshold", 0.88))
+    except Exception:
+        keyword_fuzzy_threshold = 0.88
+    keywords = config.get("keywords") or []
+    keywords_exclude = tuple(str(k).lower() for k in config.get("keywords_exclude") or [])
+    return PreviewPolicy(
+        max_age_hours=policy["max_age_hours"],
+        min_member_months=policy["min_member_months"],
+        allowed_countries=allowed_countries,
+        blocked_countries=blocked_countries,
+        allowed_country_set=_plain_country_terms(allowed_countries),
+        blocked_country_set=_plain_country_terms(blocked_countries),
+        keywords=keywords,
+        keywords_exclude=keywords_exclude,
+        keyword_rx=compile_terms([k for k, _ in prepare_keywords(keywords)]),
+        exclude_rx=compile_terms(keywords_exclude),
+        required_methods=config.get("required_contact_methods") or [],
+        keyword_fuzzy=bool(config.get("keyword_fuzzy", False)),
+        keyword_fuzzy_threshold=keyword_fuzzy_threshold,
+    )
+
+
+def _country_in(country_value: str, terms: list[str], term_set: frozenset[str]) -> bool:
+    # Exact hits are the common case; only fall back to alias/substring matching on a miss.
+    if country_value.lower() in term_set:
+        return True
+    return country_matches(country_value, terms)
+
+
+def _evaluate_lead_preview(record: dict, policy: PreviewPolicy) -> tuple[SlotConfigPreviewDecision, dict]:
     text_blob = str(record.get("text") or "")
-    time_text = record.get("time_text") or extract_time_text(text_blob)
-    age_hours = record.get("age_hours") or parse_age_hours(time_text or text_blob)
-    member_since_text = record.get("member_since_text") or extract_member_since_text(text_blob)
-    member_months = record.get("member_months") or parse_member_months(member_since_text or text_blob)
+    timing = extract_timing_fields(text_blob, record.get("time_text"), record.get("member_since_text"))
+    time_text = timing["time_text"]
+    age_hours = record.get("age_hours") or timing["age_hours"]
+    member_since_text = timing["member_since_text"]
+    member_months = record.get("member_months") or timing["member_months"]
     availability = [normalize_method(v) for v in (record.get("availability") or []) if str(v).strip()]
     structured = extract_structured_fields(text_blob)
 
@@ -253,66 +353,71 @@ def _evaluate_lead_preview(record: dict, config: dict) -> tuple[SlotConfigPrevie
     engagement_calls = record.get("engagement_calls") or structured.get("engagement_calls")
     engagement_replies = record.get("engagement_replies") or structured.get("engagement_replies")
 
-    quality_level = int(config.get("quality_level", 0))
-    policy = quality_mapping(quality_level)
-    allowed_countries = config.get("allowed_countries") or []
-    blocked_countries = config.get("blocked_countries") or []
-    keywords = config.get("keywords") or []
-    keywords_exclude = config.get("keywords_exclude") or []
-    required_methods = config.get("required_contact_methods") or []
-    keyword_fuzzy = bool(config.get("keyword_fuzzy", False))
-    try:
-        keyword_fuzzy_threshold = float(config.get("keyword_fuzzy_threshold", 0.88))
-    except Exception:
-        keyword_fuzzy_threshold = 0.88
+    keywords = policy.keywords
+    keywords_exclude = policy.keywords_exclude
+    required_methods = policy.required_methods
 
     keep = True
     reject_reason: str | None = None
-    if policy["max_age_hours"] is not None and age_hours is not None and age_hours > policy["max_age_hours"]:
+    if policy.max_age_hours is not None and age_hours is not None and age_hours > policy.max_age_hours:
         keep = False
         reject_reason = "max_age_hours"
     if (
         keep
-        and policy["min_member_months"] is not None
+        and policy.min_member_months is not None
         and member_months is not None
-        and member_months < policy["min_member_months"]
+        and member_months < policy.min_member_months
     ):
         keep = False
         reject_reason = "min_member_months"
 
     country_value = str(record.get("country") or "").strip()
-    if keep and blocked_countries and country_value and country_matches(country_value, blocked_countries):
+    if (
+        keep
+        and policy.blocked_countries
+        and country_value
+        and _country_in(country_value, policy.blocked_countries, policy.blocked_country_set)
+    ):
         keep = False
         reject_reason = "blocked_country"
 
     country_match = None
-    if keep and allowed_countries:
-        country_match = bool(country_value and country_matches(country_value, allowed_countries))
+    if keep and policy.allowed_countries:
+        country_match = bool(
+            country_value and _country_in(country_value, policy.allowed_countries, policy.allowed_country_set)
+        )
         if not country_match:
             keep = False
             reject_reason = "allowed_country"
 
-    text_for_keywords = " ".join(
-        [
-            str(record.get("title") or ""),
-            str(record.get("category_text") or ""),
-            text_blob,
-        ]
-    )
-    if keep and keywords:
-        if not keywords_match(
-            text_for_keywords,
-            keywords,
-            fuzzy_enabled=keyword_fuzzy,
-            fuzzy_threshold=keyword_fuzzy_threshold,
-        ):
-            keep = False
-            reject_reason = "keywords"
-    if keep and keywords_exclude:
+    # Only build the (possibly large) keyword text when a keyword filter can still reject the lead.
+    if keep and (keywords or keywords_exclude):
+        text_for_keywords = " ".join(
+            [
+                str(record.get("title") or ""),
+                str(record.get("category_text") or ""),
+                text_blob,
+            ]
+        )
         normalized_text = normalize_keyword_text(text_for_keywords)
-        if text_contains_any(normalized_text, keywords_exclude):
-            keep = False
-            reject_reason = "keywords_exclude"
+        if keywords:
+            if policy.keyword_fuzzy:
+                matched = keywords_match(
+                    text_for_keywords,
+                    keywords,
+                    fuzzy_enabled=True,
+                    fuzzy_threshold=policy.keyword_fuzzy_threshold,
+                    pre_normalized=normalized_text,
+                )
+            else:
+                matched = bool(policy.keyword_rx and policy.keyword_rx.search(normalized_text))
+            if not matched:
+                keep = False
+                reject_reason = "keywords"
+        if keep and keywords_exclude:
+            if policy.exclude_rx and policy.exclude_rx.search(normalized_text):
+                keep = False
+                reject_reason = "keywords_exclude"
 
     has_email = bool(record.get("email")) or "email" in availability
     has_phone = bool(record.get("phone")) or "phone" in availability
@@ -330,7 +435,7 @@ def _evaluate_lead_preview(record: dict, config: dict) -> tuple[SlotConfigPrevie
             keep = False
             reject_reason = "required_contact_methods"
 
-    decision = SlotConfigPreviewDecision(
+    decision = SlotConfigPreviewDecision.model_construct(
         keep=keep,
         reject_reason=reject_reason,
         country_match=country_match,
@@ -355,14 +460,52 @@ def _evaluate_lead_preview(record: dict, config: dict) -> tuple[SlotConfigPrevie
     return decision, fields
 
 
+def _allowed_slot_set(user: User) -> frozenset[str]:
+    allowed = getattr(user, "_allowed_slots_set", None)
+    if allowed is None:
+        allowed = frozenset(user.allowed_slots or ())
+        user._allowed_slots_set = allowed
+    return allowed
+
+
 def _assert_slot_access(user: User, slot_id: str) -> None:
     if user.role == "admin":
         return
-    if slot_id not in user.allowed_slots:
+    if slot_id not in _allowed_slot_set(user):
         raise HTTPException(status_code=403, detail="slot access denied")
 
 
+def resolved_paths(
+    slot_id: str,
+    user: User = Depends(get_current_user),
+    settings: Settings = Depends(get_settings),
+) -> SlotPaths:
+    try:
+        paths = slot_paths(settings.slots_root_path, slot_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid slot_id")
+    _assert_slot_access(user, slot_id)
+    return paths
+
+
+async def _parse_config_update(
+    request: Request,
+    user: User = Depends(get_current_user),
+) -> SlotConfigUpdateLimited:
+    adapter = _ADMIN_UPDATE_ADAPTER if user.role == "admin" else _LIMITED_UPDATE_ADAPTER
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors())
+
+
 def _load_template_config() -> dict:
+    # The template never changes while the process runs; hand out copies of the parsed one.
+    return copy.deepcopy(_read_template_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _read_template_config() -> dict:
     repo_root = Path(__file__).resolve().parents[3]
     template_path = repo_root / "config" / "slot_config.example.yml"
     if template_path.exists():
@@ -392,31 +535,58 @@ def _load_template_config() -> dict:
     }
 
 
-def _summary_from_snapshot(snapshot: SlotSnapshot) -> SlotSummary:
+def _pid_alive(pid: int) -> bool:
+    # psutil is only needed once a slot reports a pid; defer the import until then.
+    global _pid_exists
+    if _pid_exists is None:
+        from psutil import pid_exists
+
+        _pid_exists = pid_exists
+    return _pid_exists(pid)
+
+
+def _live_pids() -> set[int] | None:
+    # One /proc listing answers pid liveness for every slot in a list request.
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return {int(entry) for entry in os.listdir("/proc") if entry.isdigit()}
+    except OSError:
+        return None
+
+
+def _summary_fields(snapshot: SlotSnapshot, live_pids: set[int] | None = None) -> dict:
     pid_alive = None
     if snapshot.pid:
-        try:
-            pid_alive = psutil.pid_exists(snapshot.pid)
-        except Exception:
-            pid_alive = None
-    return SlotSummary(
-        slot_id=snapshot.slot_id,
-        phase=snapshot.phase,
-        pid=snapshot.pid,
-        pid_alive=pid_alive,
-        heartbeat_ts=snapshot.heartbeat_ts.isoformat() if snapshot.heartbeat_ts else None,
-        heartbeat_age_seconds=snapshot.heartbeat_age_seconds,
-        has_config=snapshot.config is not None,
-        has_state=snapshot.state is not None,
-        has_status=snapshot.status is not None,
-        leads_count=snapshot.leads_count,
-    )
+        if live_pids is not None:
+            pid_alive = snapshot.pid in live_pids
+        else:
+            try:
+                pid_alive = _pid_alive(snapshot.pid)
+            except Exception:
+                pid_alive = None
+    return {
+        "slot_id": snapshot.slot_id,
+        "phase": snapshot.phase,
+        "pid": snapshot.pid,
+        "pid_alive": pid_alive,
+        "heartbeat_ts": snapshot.heartbeat_ts.isoformat() if snapshot.heartbeat_ts else None,
+        "heartbeat_age_seconds": snapshot.heartbeat_age_seconds,
+        "has_config": snapshot.config is not None,
+        "has_state": snapshot.state is not None,
+        "has_status": snapshot.status is not None,
+        "leads_count": snapshot.leads_count,
+    }
+
+
+# Snapshot data is produced by core.slot_fs and already has the right types, so skip validation.
+def _summary_from_snapshot(snapshot: SlotSnapshot, live_pids: set[int] | None = None) -> SlotSummary:
+    return SlotSummary.model_construct(**_summary_fields(snapshot, live_pids))
 
 
 def _detail_from_snapshot(snapshot: SlotSnapshot) -> SlotDetail:
-    summary = _summary_from_snapshot(snapshot)
-    return SlotDetail(
-        **summary.model_dump(),
+    return SlotDetail.model_construct(
+        **_summary_fields(snapshot),
         config=snapshot.config,
         state=snapshot.state,
         status=snapshot.status,
@@ -424,29 +594,26 @@ def _detail_from_snapshot(snapshot: SlotSnapshot) -> SlotDetail:
 
 
 @router.get("", response_model=list[SlotSummary])
-def list_slots(
+async def list_slots(
     user: User = Depends(get_current_user),
     settings: Settings = Depends(get_settings),
 ) -> list[SlotSummary]:
-    ensure_slots_root(settings.slots_root_path)
-    paths = list_slot_paths(settings.slots_root_path)
+    paths = await asyncio.to_thread(list_slot_paths, settings.slots_root_path)
     if user.role != "admin":
-        paths = [p for p in paths if p.slot_id in user.allowed_slots]
-    snapshots = [read_slot_snapshot(p) for p in paths]
-    return [_summary_from_snapshot(s) for s in snapshots]
+        allowed = _allowed_slot_set(user)
+        paths = [p for p in paths if p.slot_id in allowed]
+    snapshots = await asyncio.to_thread(read_slot_snapshot_bulk, paths, max_workers=_SNAPSHOT_READ_WORKERS)
+    live_pids = await asyncio.to_thread(_live_pids) if any(s.pid for s in snapshots) else None
+    return [_summary_from_snapshot(s, live_pids) for s in snapshots]
 
 
 @router.post("/provision", response_model=SlotDetail)
 def provision_slot(
     request: SlotProvisionRequest,
-    user: User = Depends(get_current_user),
+    user: User = Depends(require_admin),
     db: Session = Depends(get_db),
     settings: Settings = Depends(get_settings),
 ) -> SlotDetail:
-    if user.role != "admin":
-        raise HTTPException(status_code=403, detail="admin role required")
-
-    ensure_slots_root(settings.slots_root_path)
     slot_id = request.slot_id.strip()
     try:
         paths = slot_paths(settings.slots_root_path, slot_id)
@@ -458,105 +625,90 @@ def provision_slot(
     paths.root.mkdir(parents=True, exist_ok=True)
     template = _load_template_config()
     write_slot_config(paths.config_path, template)
-    snapshot = read_slot_snapshot(paths)
+    snapshot = read_slot_snapshot(paths, preloaded_config=template)
     log_audit(db, settings, action="slot_provision", user=user, slot_id=slot_id)
     return _detail_from_snapshot(snapshot)
 
 
 @router.get("/{slot_id}", response_model=SlotDetail)
-def get_slot(
-    slot_id: str,
-    user: User = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
-) -> SlotDetail:
-    ensure_slots_root(settings.slots_root_path)
-    try:
-        paths = slot_paths(settings.slots_root_path, slot_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="invalid slot_id")
-    _assert_slot_access(user, slot_id)
-
+async def get_slot(paths: SlotPaths = Depends(resolved_paths)) -> SlotDetail:
     if not paths.root.exists():
         raise HTTPException(status_code=404, detail="slot not found")
 
-    snapshot = read_slot_snapshot(paths)
+    snapshot = await asyncio.to_thread(read_slot_snapshot, paths)
     return _detail_from_snapshot(snapshot)
 
 
-@router.get("/{slot_id}/leads", response_model=list[LeadItem])
-def get_slot_leads(
-    slot_id: str,
-    limit: int = Query(default=200, ge=1, le=500),
-    verified_only: bool = Query(default=False),
-    user: User = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
-) -> list[LeadItem]:
-    ensure_slots_root(settings.slots_root_path)
+def _leads_etag(path: Path, limit: int, verified_only: bool) -> str | None:
     try:
-        paths = slot_paths(settings.slots_root_path, slot_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="invalid slot_id")
-    _assert_slot_access(user, slot_id)
-
-    if not paths.root.exists():
-        raise HTTPException(status_code=404, detail="slot not found")
+        st = path.stat()
+    except OSError:
+        return None
+    key = f"{st.st_mtime_ns}:{st.st_size}:{limit}:{int(verified_only)}"
+    # Weak: GZipMiddleware may compress the body, so the bytes differ between encodings.
+    return 'W/"' + hashlib.blake2b(key.encode(), digest_size=8).hexdigest() + '"'
 
-    records = read_leads_tail(paths.leads_path, limit=limit, verified_only=verified_only)
-    results: list[LeadItem] = []
-    for record in records:
-        results.append(
-            LeadItem(
-                lead_id=record.get("lead_id"),
-                observed_at=record.get("observed_at"),
-                title=record.get("title"),
-                country=record.get("country"),
-                contact=record.get("contact"),
-                email=record.get("email"),
-                phone=record.get("phone"),
-                verified=record.get("verified"),
-                clicked=record.get("clicked"),
-                verification_source=record.get("verification_source"),
-            )
-        )
-    return results
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates or "*" in candidates
 
-@router.post("/{slot_id}/config/preview", response_model=SlotConfigPreviewResponse)
-def preview_slot_config(
-    slot_id: str,
-    request: SlotConfigPreviewRequest,
-    user: User = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
-) -> SlotConfigPreviewResponse:
-    ensure_slots_root(settings.slots_root_path)
-    try:
-        paths = slot_paths(settings.slots_root_path, slot_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="invalid slot_id")
-    _assert_slot_access(user, slot_id)
 
+@router.get("/{slot_id}/leads", response_model=list[LeadItem])
+async def get_slot_leads(
+    request: Request,
+    response: Response,
+    limit: int = Query(default=200, ge=1, le=500),
+    verified_only: bool = Query(default=False),
+    paths: SlotPaths = Depends(resolved_paths),
+) -> list[LeadItem] | Response:
     if not paths.root.exists():
         raise HTTPException(status_code=404, detail="slot not found")
 
-    base_config = read_slot_config(paths.config_path)
-    config = _build_preview_config(base_config, request.config, user)
+    # The tail only changes when leads.jsonl does, so pollers can revalidate instead of re-downloading.
+    etag = _leads_etag(paths.leads_path, limit, verified_only)
+    if etag is not None:
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Vary": "Accept-Encoding"})
+        response.headers["ETag"] = etag
+        response.headers["Vary"] = "Accept-Encoding"
+
+    records = await asyncio.to_thread(read_leads_tail, paths.leads_path, limit=limit, verified_only=verified_only)
+    results = [
+        LeadItem(
+            lead_id=record.get("lead_id"),
+            observed_at=record.get("observed_at"),
+            title=record.get("title"),
+            country=record.get("country"),
+            contact=record.get("contact"),
+            email=record.get("email"),
+            phone=record.get("phone"),
+            verified=record.get("verified"),
+            clicked=record.get("clicked"),
+            verification_source=record.get("verification_source"),
+        )
+        for record in records
+    ]
+    return results
 
-    raw = read_leads_tail(paths.leads_path, limit=min(request.limit * 5, 2000))
-    records = [r for r in raw if _is_real_lead(r)]
-    if len(records) > request.limit:
-        records = records[-request.limit :]
 
+def _preview_leads(
+    records: list[dict], policy: PreviewPolicy
+) -> tuple[list[SlotConfigPreviewLead], dict[str, int], int]:
     leads: list[SlotConfigPreviewLead] = []
-    reject_reasons: dict[str, int] = {}
+    rejected: list[str] = []
     kept = 0
     for record in records:
-        decision, fields = _evaluate_lead_preview(record, config)
+        decision, fields = _evaluate_lead_preview(record, policy)
         if decision.keep:
             kept += 1
         elif decision.reject_reason:
-            reject_reasons[decision.reject_reason] = reject_reasons.get(decision.reject_reason, 0) + 1
+            rejected.append(decision.reject_reason)
         leads.append(
-            SlotConfigPreviewLead(
+            SlotConfigPreviewLead.model_construct(
                 lead_id=record.get("lead_id"),
                 observed_at=record.get("observed_at"),
                 title=record.get("title"),
@@ -579,6 +731,32 @@ def preview_slot_config(
                 decision=decision,
             )
         )
+    return leads, dict(Counter(rejected)), kept
+
+
+@router.post("/{slot_id}/config/preview", response_model=SlotConfigPreviewResponse)
+async def preview_slot_config(
+    slot_id: str,
+    request: SlotConfigPreviewRequest,
+    user: User = Depends(get_current_user),
+    paths: SlotPaths = Depends(resolved_paths),
+) -> SlotConfigPreviewResponse:
+    if not paths.root.exists():
+        raise HTTPException(status_code=404, detail="slot not found")
+
+    base_config = await asyncio.to_thread(read_slot_config, paths.config_path)
+    config = _build_preview_config(base_config, request.config, user)
+
+    records = await asyncio.to_thread(
+        read_leads_tail,
+        paths.leads_path,
+        limit=request.limit,
+        predicate=_is_real_lead,
+        scan_limit=min(request.limit * 5, 2000),
+    )
+
+    policy = _build_preview_policy(config)
+    leads, reject_reasons, kept = await asyncio.to_thread(_preview_leads, records, policy)
 
     summary = SlotConfigPreviewSummary(
         total=len(records),
@@ -598,19 +776,22 @@ def preview_slot_config(
 @router.get("/{slot_id}/leads.jsonl")
 def download_slot_leads(
     slot_id: str,
-    user: User = Depends(get_current_user),
     settings: Settings = Depends(get_settings),
-) -> FileResponse:
-    ensure_slots_root(settings.slots_root_path)
-    try:
-        paths = slot_paths(settings.slots_root_path, slot_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="invalid slot_id")
-    _assert_slot_access(user, slot_id)
-
+    paths: SlotPaths = Depends(resolved_paths),
+) -> Response:
     if not paths.leads_path.exists():
         raise HTTPException(status_code=404, detail="leads not found")
 
+    if settings.leads_accel_redirect_prefix:
+        # Behind nginx, let the proxy sendfile() the leads file straight from disk.
+        prefix = settings.leads_accel_redirect_prefix.rstrip("/")
+        return Response(
+            headers={
+                "X-Accel-Redirect": f"{prefix}/{slot_id}/leads.jsonl",
+                "Content-Type": "application/jsonl",
+                "Content-Disposition": f'attachment; filename="{slot_id}_leads.jsonl"',
+            }
+        )
     return FileResponse(
         path=paths.leads_path,
         media_type="application/jsonl",
@@ -618,21 +799,15 @@ def download_slot_leads(
     )
 
 
-@router.patch("/{slot_id}/config", response_model=SlotDetail)
+@router.patch("/{slot_id}/config", response_model=SlotDetail, openapi_extra=_CONFIG_UPDATE_BODY)
 def patch_slot_config(
     slot_id: str,
-    update: SlotConfigUpdate,
+    update: SlotConfigUpdateLimited = Depends(_parse_config_update),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     settings: Settings = Depends(get_settings),
+    paths: SlotPaths = Depends(resolved_paths),
 ) -> SlotDetail:
-    ensure_slots_root(settings.slots_root_path)
-    try:
-        paths = slot_paths(settings.slots_root_path, slot_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="invalid slot_id")
-    _assert_slot_access(user, slot_id)
-
     current = read_slot_config(paths.config_path)
     if not current:
         current = {"version": 1}
@@ -651,22 +826,6 @@ def patch_slot_config(
     if "channels" in payload:
         payload["channels"] = _normalize_channels(payload.get("channels"))
 
-    if user.role != "admin":
-        allowed_fields = {
-            "quality_level",
-            "dry_run",
-            "max_clicks_per_cycle",
-            "max_run_minutes",
-            "allowed_countries",
-            "keywords",
-            "keywords_exclude",
-            "required_contact_methods",
-            "keyword_fuzzy",
-            "keyword_fuzzy_threshold",
-            "channels",
-        }
-        payload = {k: v for k, v in payload.items() if k in allowed_fields}
-
     for key, value in payload.items():
         if value is None:
             current.pop(key, None)
@@ -675,7 +834,7 @@ def patch_slot_config(
 
     current.setdefault("version", 1)
     write_slot_config(paths.config_path, current)
-    snapshot = read_slot_snapshot(paths)
+    snapshot = read_slot_snapshot(paths, preloaded_config=current)
     log_audit(
         db,
         settings,
@@ -691,13 +850,10 @@ def patch_slot_config(
 def replace_slot_config(
     slot_id: str,
     payload: SlotConfigReplace,
-    user: User = Depends(get_current_user),
+    user: User = Depends(require_admin),
     db: Session = Depends(get_db),
     settings: Settings = Depends(get_settings),
 ) -> SlotDetail:
-    if user.role != "admin":
-        raise HTTPException(status_code=403, detail="admin role required")
-    ensure_slots_root(settings.slots_root_path)
     try:
         paths = slot_paths(settings.slots_root_path, slot_id)
     except ValueError:
@@ -709,7 +865,7 @@ def replace_slot_config(
     updated = dict(payload.config)
     updated.setdefault("version", 1)
     write_slot_config(paths.config_path, updated)
-    snapshot = read_slot_snapshot(paths)
+    snapshot = read_slot_snapshot(paths, preloaded_config=updated)
     log_audit(
         db,
         settings,
@@ -727,16 +883,15 @@ def start_slot(
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     settings: Settings = Depends(get_settings),
+    _paths: SlotPaths = Depends(resolved_paths),
 ) -> SlotActionResponse:
-    ensure_slots_root(settings.slots_root_path)
     mgr = get_manager()
-    _assert_slot_access(user, slot_id)
     try:
         mgr.start_slot(slot_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="invalid slot_id")
     log_audit(db, settings, action="slot_start", user=user, slot_id=slot_id)
-    return SlotActionResponse(slot_id=slot_id, action="start", status="ok")
+    return SlotActionResponse.model_construct(slot_id=slot_id, action="start", status="ok")
 
 
 @router.post("/{slot_id}/stop", response_model=SlotActionResponse)
@@ -745,13 +900,12 @@ def stop_slot(
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     settings: Settings = Depends(get_settings),
+    _paths: SlotPaths = Depends(resolved_paths),
 ) -> SlotActionResponse:
-    ensure_slots_root(settings.slots_root_path)
     mgr = get_manager()
-    _assert_slot_access(user, slot_id)
     mgr.stop_slot(slot_id, force=True)
     log_audit(db, settings, action="slot_stop", user=user, slot_id=slot_id)
-    return SlotActionResponse(slot_id=slot_id, action="stop", status="ok")
+    return SlotActionResponse.model_construct(slot_id=slot_id, action="stop", status="ok")
 
 
 @router.post("/{slot_id}/restart", response_model=SlotActionResponse)
@@ -760,14 +914,13 @@ def restart_slot(
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     settings: Settings = Depends(get_settings),
+    _paths: SlotPaths = Depends(resolved_paths),
 ) -> SlotActionResponse:
-    ensure_slots_root(settings.slots_root_path)
     mgr = get_manager()
-    _assert_slot_access(user, slot_id)
     try:
         mgr.stop_slot(slot_id, force=True)
         mgr.start_slot(slot_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="invalid slot_id")
     log_audit(db, settings, action="slot_restart", user=user, slot_id=slot_id)
-    return SlotActionResponse(slot_id=slot_id, action="restart", status="ok")
+    return SlotActionResponse.model_construct(slot_id=slot_id, action="restart", status="ok")
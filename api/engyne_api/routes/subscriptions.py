@@ -1,20 +1,24 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
-from core.slot_fs import ensure_slots_root, slot_paths
-from engyne_api.audit import log_audit
-from engyne_api.auth.deps import get_current_user
+from core.slot_fs import slot_paths
+from engyne_api.audit import log_audit_deferred
+from engyne_api.auth.deps import get_current_user, require_admin
 from engyne_api.db.deps import get_db
 from engyne_api.db.models import SlotSubscription, User
 from engyne_api.settings import Settings, get_settings
 
 router = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
 
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 class SubscriptionEntry(BaseModel):
     slot_id: str
@@ -29,6 +33,9 @@ class SubscriptionEntry(BaseModel):
     updated_at: datetime
 
 
+_SUBSCRIPTION_LIST_ADAPTER = TypeAdapter(list[SubscriptionEntry])
+
+
 class SubscriptionUpsertRequest(BaseModel):
     email: str
     slot_id: str
@@ -39,9 +46,16 @@ class SubscriptionUpsertRequest(BaseModel):
     notes: str | None = None
 
 
+def _dialect_insert(db: Session):
+    # Both supported backends (SQLite for local runs, Postgres in prod) speak ON CONFLICT.
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
+
 def _normalize_email(value: str) -> str:
     email = value.strip().lower()
-    if not email or "@" not in email or "." not in email:
+    if not _EMAIL_RE.match(email):
         raise HTTPException(status_code=400, detail="invalid email")
     return email
 
@@ -52,30 +66,24 @@ def list_subscriptions(
     slot_id: str | None = Query(default=None),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> list[SubscriptionEntry]:
-    query = db.query(SlotSubscription)
+) -> Response:
+    # user_id has no FK to users, so outer-join to keep rows whose user was removed.
+    query = db.query(SlotSubscription, User.email).outerjoin(User, User.id == SlotSubscription.user_id)
     if user.role != "admin":
         query = query.filter(SlotSubscription.user_id == user.id)
     else:
         if email:
-            target = db.query(User).filter(User.email == _normalize_email(email)).one_or_none()
-            if target is None:
-                return []
-            query = query.filter(SlotSubscription.user_id == target.id)
+            query = query.filter(User.email == _normalize_email(email))
         if slot_id:
             query = query.filter(SlotSubscription.slot_id == slot_id)
 
-    subscriptions = query.all()
-    user_ids = {sub.user_id for sub in subscriptions}
-    users = {u.id: u.email for u in db.query(User).filter(User.id.in_(user_ids)).all()} if user_ids else {}
-
     results: list[SubscriptionEntry] = []
-    for sub in subscriptions:
+    for sub, sub_email in query.all():
         results.append(
-            SubscriptionEntry(
+            SubscriptionEntry.model_construct(
                 slot_id=sub.slot_id,
                 user_id=sub.user_id,
-                email=users.get(sub.user_id, ""),
+                email=sub_email or "",
                 plan=sub.plan,
                 status=sub.status,
                 starts_at=sub.starts_at,
@@ -85,25 +93,24 @@ def list_subscriptions(
                 updated_at=sub.updated_at,
             )
         )
-    return results
+    # response_model stays on the route for the OpenAPI schema; serialize directly to skip re-validation.
+    return Response(content=_SUBSCRIPTION_LIST_ADAPTER.dump_json(results), media_type="application/json")
 
 
 @router.post("", response_model=SubscriptionEntry)
 def upsert_subscription(
     payload: SubscriptionUpsertRequest,
-    user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    user: User = Depends(require_admin),
     db: Session = Depends(get_db),
     settings: Settings = Depends(get_settings),
 ) -> SubscriptionEntry:
-    if user.role != "admin":
-        raise HTTPException(status_code=403, detail="admin role required")
-
+    actor_id = user.id  # read now; commit() expires the instance before the audit task runs
     email = _normalize_email(payload.email)
     slot_id = payload.slot_id.strip()
     if not slot_id:
         raise HTTPException(status_code=400, detail="slot_id required")
 
-    ensure_slots_root(settings.slots_root_path)
     paths = slot_paths(settings.slots_root_path, slot_id)
     if not paths.root.exists():
         raise HTTPException(status_code=404, detail="slot not found")
@@ -121,39 +128,45 @@ def upsert_subscription(
             target.allowed_slots = sorted(allowed)
         target.updated_at = datetime.now(timezone.utc)
 
-    existing = (
-        db.query(SlotSubscription)
-        .filter(SlotSubscription.slot_id == slot_id, SlotSubscription.user_id == target.id)
-        .one_or_none()
+    if created_user:
+        # Assigns the new user's id so the subscription upsert can reference it.
+        db.flush()
+
+    user_id = target.id
+    now = datetime.now(timezone.utc)
+    fields = {
+        "plan": payload.plan,
+        "status": payload.status,
+        "starts_at": payload.starts_at,
+        "ends_at": payload.ends_at,
+        "notes": payload.notes,
+    }
+    stmt = _dialect_insert(db)(SlotSubscription).values(slot_id=slot_id, user_id=user_id, **fields)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SlotSubscription.slot_id, SlotSubscription.user_id],
+        set_={**fields, "updated_at": now},
+    ).returning(SlotSubscription)
+    existing = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+    # Build the response before commit() expires the returned row, so it needs no refresh SELECT.
+    entry = SubscriptionEntry(
+        slot_id=existing.slot_id,
+        user_id=existing.user_id,
+        email=email,
+        plan=existing.plan,
+        status=existing.status,
+        starts_at=existing.starts_at,
+        ends_at=existing.ends_at,
+        notes=existing.notes,
+        created_at=existing.created_at,
+        updated_at=existing.updated_at,
     )
-    if existing is None:
-        existing = SlotSubscription(
-            slot_id=slot_id,
-            user_id=target.id,
-            plan=payload.plan,
-            status=payload.status,
-            starts_at=payload.starts_at,
-            ends_at=payload.ends_at,
-            notes=payload.notes,
-        )
-        db.add(existing)
-    else:
-        existing.plan = payload.plan
-        existing.status = payload.status
-        existing.starts_at = payload.starts_at
-        existing.ends_at = payload.ends_at
-        existing.notes = payload.notes
-        existing.updated_at = datetime.now(timezone.utc)
-
     db.commit()
-    db.refresh(existing)
-    db.refresh(target)
 
-    log_audit(
-        db,
+    background_tasks.add_task(
+        log_audit_deferred,
         settings,
         action="subscription_upsert",
-        user=user,
+        user_id=actor_id,
         details={
             "slot_id": slot_id,
             "email": email,
@@ -163,15 +176,4 @@ def upsert_subscription(
         },
     )
 
-    return SubscriptionEntry(
-        slot_id=existing.slot_id,
-        user_id=existing.user_id,
-        email=target.email,
-        plan=existing.plan,
-        status=existing.status,
-        starts_at=existing.starts_at,
-        ends_at=existing.ends_at,
-        notes=existing.notes,
-        created_at=existing.created_at,
-        updated_at=existing.updated_at,
-    )
+    return entry
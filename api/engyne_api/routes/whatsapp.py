@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import base64
+import functools
+from collections.abc import AsyncIterator, Mapping
+from types import MappingProxyType
 from urllib.parse import urlencode
 
-import requests
+import aiohttp
 from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from engyne_api.auth.deps import get_current_user
+from engyne_api.http_client import get_http_session
 from engyne_api.settings import Settings, get_settings
 
 router = APIRouter(prefix="/whatsapp", tags=["whatsapp"])
@@ -19,15 +25,21 @@ def _session_name(slot_id: str, settings: Settings) -> str:
     return f"{prefix}{slot_id}"
 
 
-def _waha_headers(settings: Settings) -> dict[str, str]:
+def _waha_headers(settings: Settings) -> Mapping[str, str]:
+    return _build_waha_headers(settings.waha_token, settings.waha_auth_header, settings.waha_auth_prefix)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_waha_headers(waha_token: str | None, auth_header: str, auth_prefix: str) -> Mapping[str, str]:
     headers: dict[str, str] = {}
-    if settings.waha_token:
-        if settings.waha_auth_header.lower() == "authorization":
-            token = f"{settings.waha_auth_prefix} {settings.waha_token}".strip()
-            headers[settings.waha_auth_header] = token
+    if waha_token:
+        if auth_header.lower() == "authorization":
+            token = f"{auth_prefix} {waha_token}".strip()
+            headers[auth_header] = token
         else:
-            headers[settings.waha_auth_header] = settings.waha_token
-    return headers
+            headers[auth_header] = waha_token
+    # Shared across requests, so hand out a read-only view.
+    return MappingProxyType(headers)
 
 
 def _waha_url(base_url: str, path: str, session: str | None, session_param: str | None) -> str:
@@ -42,8 +54,16 @@ def _waha_url(base_url: str, path: str, session: str | None, session_param: str
     return url
 
 
+async def _iter_body(resp: aiohttp.ClientResponse) -> AsyncIterator[bytes]:
+    try:
+        async for chunk in resp.content.iter_chunked(64 * 1024):
+            yield chunk
+    finally:
+        resp.release()
+
+
 @router.post("/{slot_id}/session/start")
-def start_session(
+async def start_session(
     slot_id: str,
     settings: Settings = Depends(get_settings),
     _user=Depends(get_current_user),
@@ -54,24 +74,27 @@ def start_session(
     url = settings.waha_base_url.rstrip("/") + settings.waha_sessions_path
     payload = {"name": session}
     headers = _waha_headers(settings)
+    http = get_http_session()
     try:
-        resp = requests.post(url, json=payload, headers=headers, timeout=10)
+        async with http.post(url, json=payload, headers=headers) as resp:
+            status = resp.status
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"WAHA request failed: {exc}")
-    if not (200 <= resp.status_code < 300):
+    if not (200 <= status < 300):
         # WAHA core only supports 'default' and may require explicit start.
         fallback_url = f"{settings.waha_base_url.rstrip('/')}/api/sessions/{session}/start"
         try:
-            fallback = requests.post(fallback_url, headers=headers, timeout=10)
+            async with http.post(fallback_url, headers=headers) as fallback:
+                fallback_status = fallback.status
         except Exception as exc:
             raise HTTPException(status_code=502, detail=f"WAHA request failed: {exc}")
-        if not (200 <= fallback.status_code < 300) and fallback.status_code not in {409, 422}:
-            raise HTTPException(status_code=502, detail=f"WAHA error: {fallback.status_code}")
+        if not (200 <= fallback_status < 300) and fallback_status not in {409, 422}:
+            raise HTTPException(status_code=502, detail=f"WAHA error: {fallback_status}")
     return {"slot_id": slot_id, "session": session, "status": "started"}
 
 
 @router.get("/{slot_id}/qr")
-def get_qr(
+async def get_qr(
     slot_id: str,
     settings: Settings = Depends(get_settings),
     _user=Depends(get_current_user),
@@ -81,22 +104,31 @@ def get_qr(
     session = _session_name(slot_id, settings)
     url = _waha_url(settings.waha_base_url, settings.waha_screenshot_path, session, settings.waha_screenshot_session_param)
     try:
-        resp = requests.get(url, headers=_waha_headers(settings), timeout=10)
+        resp = await get_http_session().get(url, headers=_waha_headers(settings))
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"WAHA request failed: {exc}")
-    if not (200 <= resp.status_code < 300):
-        raise HTTPException(status_code=502, detail=f"WAHA error: {resp.status_code}")
+    if not (200 <= resp.status < 300):
+        resp.release()
+        raise HTTPException(status_code=502, detail=f"WAHA error: {resp.status}")
 
     content_type = resp.headers.get("content-type", "application/octet-stream")
-    if "application/json" in content_type:
-        data = resp.json()
-        for key in ("data", "base64", "qr"):
-            if key in data and isinstance(data[key], str):
-                raw = data[key]
-                if raw.startswith("data:image"):
-                    _, b64 = raw.split(",", 1)
-                    return Response(content=base64.b64decode(b64), media_type="image/png")
-                return Response(content=base64.b64decode(raw), media_type="image/png")
-        raise HTTPException(status_code=502, detail="WAHA QR response missing image payload")
-
-    return Response(content=resp.content, media_type=content_type)
+    if "application/json" not in content_type:
+        # Relay the image as it arrives instead of buffering it first. The background task releases the
+        # connection even if the body iterator is never started or is abandoned mid-stream.
+        return StreamingResponse(_iter_body(resp), media_type=content_type, background=BackgroundTask(resp.release))
+
+    try:
+        data = await resp.json(content_type=None)
+    except Exception as exc:
+        raise HTTPException(status_code=502, detail=f"WAHA request failed: {exc}")
+    finally:
+        resp.release()
+
+    for key in ("data", "base64", "qr"):
+        if key in data and isinstance(data[key], str):
+            raw = data[key]
+            if raw.startswith("data:image"):
+                _, b64 = raw.split(",", 1)
+                return Response(content=base64.b64decode(b64), media_type="image/png")
+            return Response(content=base64.b64decode(raw), media_type="image/png")
+    raise HTTPException(status_code=502, detail="WAHA QR response missing image payload")
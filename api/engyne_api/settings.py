@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from functools import lru_cache
+import json
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import FrozenSet, Optional
 
@@ -78,6 +79,7 @@ class Settings(BaseSettings):
     waha_auth_header: str = Field(default="Authorization", alias="WAHA_AUTH_HEADER")
     waha_auth_prefix: str = Field(default="Bearer", alias="WAHA_AUTH_PREFIX")
     waha_token: Optional[str] = Field(default=None, alias="WAHA_TOKEN")
+    leads_accel_redirect_prefix: Optional[str] = Field(default=None, alias="LEADS_ACCEL_REDIRECT_PREFIX")
     remote_login_ttl_seconds: int = Field(
         default=900, alias="REMOTE_LOGIN_TTL_SECONDS", ge=60
     )
@@ -102,19 +104,17 @@ class Settings(BaseSettings):
         if value is None:
             return frozenset()
         if isinstance(value, (set, frozenset, list, tuple)):
-            return frozenset(str(v).strip().lower() for v in value if str(v).strip())
+            return frozenset(s for v in value if (s := str(v).strip().lower()))
         if isinstance(value, str):
             raw = value.strip()
             if not raw:
                 return frozenset()
             if raw.startswith("["):
-                import json
-
                 parsed = json.loads(raw)
                 if not isinstance(parsed, list):
                     raise TypeError("expected JSON array")
-                return frozenset(str(v).strip().lower() for v in parsed if str(v).strip())
-            return frozenset(v.strip().lower() for v in raw.split(",") if v.strip())
+                return frozenset(s for v in parsed if (s := str(v).strip().lower()))
+            return frozenset(s for part in raw.lower().split(",") if (s := part.strip()))
         raise TypeError("expected CSV string or JSON array")
 
     @property
@@ -125,21 +125,22 @@ class Settings(BaseSettings):
     def is_https(self) -> bool:
         return str(self.public_api_base_url).lower().startswith("https://")
 
-    @property
+    # resolve() hits the filesystem; these are read on hot paths, so resolve once per Settings instance.
+    @cached_property
     def slots_root_path(self) -> Path:
         return Path(self.slots_root).expanduser().resolve()
 
-    @property
+    @cached_property
     def runtime_path(self) -> Path:
         return Path(self.runtime_root).expanduser().resolve()
 
-    @property
+    @cached_property
     def indiamart_profile_path_path(self) -> Path | None:
         if not self.indiamart_profile_path:
             return None
         return Path(self.indiamart_profile_path).expanduser().resolve()
 
-    @property
+    @cached_property
     def nodes_config_path_path(self) -> Path:
         return Path(self.nodes_config_path).expanduser().resolve()
 
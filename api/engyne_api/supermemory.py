@@ -1,29 +1,41 @@
 from __future__ import annotations
 
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from engyne_api.settings import Settings
 
+# Reuse the TCP/TLS connection to the Supermemory API across calls.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
-def _auth_headers(settings: Settings) -> dict[str, str] | None:
+
+def _auth_headers(settings: Settings) -> Mapping[str, str] | None:
     if not settings.supermemory_api_key:
         return None
-    return {"Authorization": f"Bearer {settings.supermemory_api_key}"}
+    return _build_auth_headers(settings.supermemory_api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_auth_headers(api_key: str) -> Mapping[str, str]:
+    return MappingProxyType({"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"})
 
 
 def push_document(settings: Settings, content: str, metadata: dict[str, Any] | None = None) -> bool:
     headers = _auth_headers(settings)
     if not headers:
         return False
-    headers["Content-Type"] = "application/json"
     url = f"{settings.supermemory_base_url.rstrip('/')}/v3/documents"
     payload: dict[str, Any] = {"content": content}
     if metadata:
         payload["metadata"] = metadata
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=10)
+        resp = _SESSION.post(url, headers=headers, json=payload, timeout=10)
         return 200 <= resp.status_code < 300
     except Exception:
         return False
@@ -33,11 +45,10 @@ def search_documents(settings: Settings, query: str, limit: int = 5) -> list[dic
     headers = _auth_headers(settings)
     if not headers:
         return []
-    headers["Content-Type"] = "application/json"
     url = f"{settings.supermemory_base_url.rstrip('/')}/v3/search"
     payload = {"q": query, "limit": limit}
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=10)
+        resp = _SESSION.post(url, headers=headers, json=payload, timeout=10)
         if resp.status_code >= 300:
             return []
         data = resp.json()
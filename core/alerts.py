@@ -1,25 +1,37 @@
 from __future__ import annotations
 
+import functools
 import os
 from datetime import datetime, timezone
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Reuse the TCP/TLS connection to the webhook host across alerts.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 
 def utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@functools.lru_cache(maxsize=1)
+def _slack_webhook_url() -> str:
+    # The environment is fixed for the life of the process, so read it once.
+    return os.environ.get("ALERTS_SLACK_WEBHOOK_URL", "").strip()
+
+
 def send_slack_alert(title: str, message: str) -> None:
-    url = os.environ.get("ALERTS_SLACK_WEBHOOK_URL", "").strip()
+    url = _slack_webhook_url()
     if not url:
         return
     payload: dict[str, Any] = {
         "text": f"*{title}*\\n{message}\\nTime: {utc_now()}",
     }
     try:
-        requests.post(url, json=payload, timeout=5)
+        _SESSION.post(url, json=payload, timeout=5)
     except Exception:
         # Alert failures should never crash the manager.
         return
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
 import argparse
-import json
+import ctypes
+import ctypes.util
+import hashlib
 import os
+import re
+import select
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
-from core.queues import append_jsonl, utc_now
+from core.queues import append_jsonl_many, utc_now
 from core.slot_fs import read_slot_config, slot_paths
 from core.llm_ollama import generate_message
 
+# Fold the contact_state change log into the snapshot once it outgrows this many entries
+# (or 4x the number of leads in the snapshot, whichever is larger).
+CONTACT_LOG_COMPACT_MIN = 1000
+# Checkpoint state + offset at least this often within a poll cycle (and right after any real send).
+FLUSH_EVERY = 32
+# Rate windows are kept in memory for the life of the process and written to rate.json at most this often
+# (and on shutdown). A crash can forget up to this many seconds of sends, i.e. briefly exceed the limit.
+RATE_SAVE_SECONDS = 30.0
+
 CHANNELS = ("whatsapp", "telegram", "email", "sheets", "push", "slack")
 CONTACT_KEYS = {
     "whatsapp": ("whatsapp", "phone", "mobile", "phone_number"),
@@ -24,6 +39,66 @@ CONTACT_KEYS = {
 }
 
 
+# Top-level string fields peeked from a raw queue line without a full parse. Only trusted when the key
+# occurs exactly once and the value has no escapes; anything else falls back to a full parse.
+_LEAD_ID_RE = re.compile(rb'"lead_id"\s*:\s*"([^"\\]+)"')
+_SLOT_ID_RE = re.compile(rb'"slot_id"\s*:\s*"([^"\\]+)"')
+_SETTLED_STATUSES = frozenset({"sent", "skipped", "blocked"})
+# Deletes everything but digits and "+" from ASCII contacts in one translate call.
+_WAHA_DROP_CHARS = str.maketrans("", "", "".join(chr(c) for c in range(128) if not (chr(c).isdigit() or chr(c) == "+")))
+
+_RATE: dict[str, Any] = {"state": None, "dirty": False, "saved_at": 0.0}
+# Long-lived buffered handles for the sent/proofs logs; flushed with every state checkpoint.
+_SINKS: dict[Path, BinaryIO] = {}
+_PATHS_CACHE: dict[tuple[Path, str], dict[str, Path]] = {}
+_SAVED_DIGESTS: dict[Path, bytes] = {}
+# Built messages by lead_id (each dispatcher process serves one channel); oldest entries are evicted first.
+MESSAGE_CACHE_SIZE = 1024
+_MESSAGE_CACHE: dict[str, str] = {}
+
+# One keep-alive pool per dispatcher process for the webhook and WAHA hosts.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+_IN_MODIFY = 0x00000002
+
+
+class QueueWatch:
+    """Wakes the poll loop when the queue file is appended to (inotify on Linux, plain sleep elsewhere)."""
+
+    def __init__(self, path: Path) -> None:
+        self.fd = -1
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return
+        if fd < 0:
+            return
+        # Watch the file itself rather than runtime/, which sees every other channel's writes too.
+        if libc.inotify_add_watch(fd, os.fsencode(str(path)), _IN_MODIFY) < 0:
+            os.close(fd)
+            return
+        self.fd = fd
+
+    def wait(self, timeout: float) -> None:
+        if self.fd < 0:
+            time.sleep(timeout)
+            return
+        # Still bounded by poll_seconds so held records (rate limit, config changes) get retried.
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            try:
+                while os.read(self.fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+
 @dataclass
 class DispatcherConfig:
     channel: str
@@ -43,6 +118,16 @@ class DispatcherConfig:
     waha_chat_suffix: str = "@c.us"
     waha_auth_header: str = "Authorization"
     waha_auth_prefix: str = "Bearer"
+    webhook_batch_max: int = 1
+    # Derived from the fields above once, so process_record does not re-test the channel per record.
+    contact_keys: tuple[str, ...] = field(init=False)
+    needs_contact: bool = field(init=False)
+    use_waha: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.contact_keys = CONTACT_KEYS.get(self.channel, ())
+        self.needs_contact = self.channel in CONTACT_KEYS
+        self.use_waha = self.channel == "whatsapp" and bool(self.waha_base_url and self.waha_session)
 
 
 def coerce_bool(value: Any, default: bool = False) -> bool:
@@ -61,16 +146,54 @@ def load_json(path: Path, default: Any) -> Any:
     if not path.exists():
         return default
     try:
-        return json.loads(path.read_text())
+        return orjson.loads(path.read_bytes())
     except Exception:
         return default
 
 
 def save_json(path: Path, data: Any) -> None:
+    body = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    digest = hashlib.blake2b(body, digest_size=16).digest()
+    # Skip the tmp write + rename when this process last wrote exactly these bytes.
+    if _SAVED_DIGESTS.get(path) == digest:
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(".tmp")
-    tmp.write_text(json.dumps(data, indent=2))
+    tmp.write_bytes(body)
     tmp.replace(path)
+    _SAVED_DIGESTS[path] = digest
+
+
+def load_contact_state(paths: dict[str, Path]) -> tuple[dict[str, Any], int]:
+    """Load the contact_state snapshot and replay the append-only change log on top of it."""
+    state = load_json(paths["contact_state"], {})
+    if not isinstance(state, dict):
+        state = {}
+    log_entries = 0
+    try:
+        with paths["contact_state_log"].open("rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = orjson.loads(line)
+                except Exception:
+                    # A torn last line from a crash mid-append; the lead is simply reprocessed.
+                    continue
+                lead_id = entry.pop("lead_id", None) if isinstance(entry, dict) else None
+                if lead_id:
+                    state[lead_id] = entry
+                    log_entries += 1
+    except FileNotFoundError:
+        pass
+    return state, log_entries
+
+
+def compact_contact_state(paths: dict[str, Path], contact_state: dict[str, Any]) -> None:
+    # Snapshot first, then truncate: replaying a stale log over a newer snapshot is harmless.
+    save_json(paths["contact_state"], contact_state)
+    paths["contact_state_log"].write_text("")
 
 
 def load_channel_config(slot_id: str, slots_root: Path, cache: dict[str, dict[str, Any]]) -> dict[str, Any]:
@@ -99,21 +222,40 @@ def is_channel_enabled(slot_id: str, channel: str, slots_root: Path, cache: dict
     return bool(channels.get(channel))
 
 
-def read_offset(path: Path) -> int:
+def read_offset(path: Path, queue_path: Path) -> int:
+    """Return the queue byte offset, converting a legacy line-count offset on first read."""
     if not path.exists():
         return 0
     try:
-        return int(path.read_text().strip() or "0")
+        raw = path.read_text().strip()
+        if raw.startswith("b:"):
+            return int(raw[2:])
+        lines = int(raw or "0")
     except Exception:
         return 0
+    if lines <= 0:
+        return 0
+    offset = 0
+    with queue_path.open("rb") as f:
+        for _ in range(lines):
+            line = f.readline()
+            if not line:
+                break
+            offset += len(line)
+    return offset
 
 
 def write_offset(path: Path, value: int) -> None:
+    # "b:" marks a byte offset; older files hold a bare line count.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(str(value))
+    path.write_text(f"b:{value}")
 
 
 def ensure_channel_files(runtime_root: Path, channel: str) -> dict[str, Path]:
+    key = (runtime_root, channel)
+    cached = _PATHS_CACHE.get(key)
+    if cached is not None:
+        return cached
     runtime_root.mkdir(parents=True, exist_ok=True)
     paths = {
         "queue": runtime_root / f"{channel}_queue.jsonl",
@@ -121,18 +263,24 @@ def ensure_channel_files(runtime_root: Path, channel: str) -> dict[str, Path]:
         "sent": runtime_root / f"{channel}_queue.sent.jsonl",
         "rate": runtime_root / f"{channel}_queue.rate.json",
         "contact_state": runtime_root / f"{channel}_queue.contact_state.json",
+        "contact_state_log": runtime_root / f"{channel}_queue.contact_state.log.jsonl",
         "proofs": runtime_root / f"{channel}_queue.proofs.jsonl",
     }
+    # List runtime/ once and create only what is missing, then reuse the paths for the process lifetime.
+    with os.scandir(runtime_root) as entries:
+        existing = {entry.name for entry in entries}
     for path in paths.values():
-        path.touch(exist_ok=True)
+        if path.name not in existing:
+            path.touch(exist_ok=True)
+    _PATHS_CACHE[key] = paths
     return paths
 
 
-def extract_contact(payload: dict[str, Any], channel: str) -> str | None:
-    for key in CONTACT_KEYS.get(channel, ()):
+def extract_contact(payload: dict[str, Any], keys: tuple[str, ...]) -> str | None:
+    for key in keys:
         value = payload.get(key)
         if value:
-            return str(value)
+            return value if type(value) is str else str(value)
     return None
 
 
@@ -160,10 +308,20 @@ def build_message(record: dict[str, Any], channel: str) -> str:
     custom = payload.get("message") or record.get("message")
     if isinstance(custom, str) and custom.strip():
         return custom.strip()
-    generated = generate_message(record, channel)
-    if generated:
-        return generated
-    return format_message(record)
+    lead_id = record.get("lead_id")
+    cached = _MESSAGE_CACHE.get(lead_id) if lead_id else None
+    if cached is not None:
+        return cached
+    message = generate_message(record, channel)
+    if not message:
+        # Not cached, so a retry gets another chance at an Ollama message once it is reachable.
+        return format_message(record)
+    if lead_id:
+        # A failed send is retried on the next poll; reuse the message rather than asking Ollama again.
+        if len(_MESSAGE_CACHE) >= MESSAGE_CACHE_SIZE:
+            del _MESSAGE_CACHE[next(iter(_MESSAGE_CACHE))]
+        _MESSAGE_CACHE[lead_id] = message
+    return message
 
 
 def normalize_waha_chat_id(contact: str, suffix: str) -> str | None:
@@ -172,13 +330,34 @@ def normalize_waha_chat_id(contact: str, suffix: str) -> str | None:
         return None
     if "@c.us" in raw or "@g.us" in raw:
         return raw
-    digits = "".join(ch for ch in raw if ch.isdigit() or ch == "+")
+    if raw.isascii():
+        digits = raw.translate(_WAHA_DROP_CHARS)
+    else:
+        digits = "".join(ch for ch in raw if ch.isdigit() or ch == "+")
     digits = digits.lstrip("+")
     if not digits:
         return None
     return f"{digits}{suffix}"
 
 
+def load_rate_state(paths: dict[str, Path]) -> dict[str, Any]:
+    if _RATE["state"] is None:
+        _RATE["state"] = load_json(paths["rate"], {})
+        _RATE["saved_at"] = time.monotonic()
+    return _RATE["state"]
+
+
+def save_rate_state(paths: dict[str, Path], force: bool = False) -> None:
+    if _RATE["state"] is None or not _RATE["dirty"]:
+        return
+    now = time.monotonic()
+    if not force and now - _RATE["saved_at"] < RATE_SAVE_SECONDS:
+        return
+    save_json(paths["rate"], _RATE["state"])
+    _RATE["dirty"] = False
+    _RATE["saved_at"] = now
+
+
 def can_send(rate_state: dict[str, Any], slot_id: str, rate_per_minute: int) -> bool:
     if rate_per_minute <= 0:
         return True
@@ -204,11 +383,17 @@ def mark_sent(rate_state: dict[str, Any], slot_id: str) -> None:
     rate_state[slot_id] = slot_state
 
 
+def unmark_sent(rate_state: dict[str, Any], slot_id: str) -> None:
+    slot_state = rate_state.get(slot_id)
+    if slot_state:
+        slot_state["sent"] = max(0, int(slot_state.get("sent", 0)) - 1)
+
+
 def send_webhook(url: str, secret: str | None, payload: dict[str, Any]) -> bool:
     headers = {"Content-Type": "application/json"}
     if secret:
         headers["X-Engyne-Channel-Secret"] = secret
-    resp = requests.post(url, headers=headers, json=payload, timeout=10)
+    resp = _SESSION.post(url, headers=headers, data=orjson.dumps(payload), timeout=10)
     return 200 <= resp.status_code < 300
 
 
@@ -245,19 +430,70 @@ def send_whatsapp_waha(cfg: DispatcherConfig, contact: str, record: dict[str, An
         "chatId": chat_id,
         "text": message_text,
     }
-    resp = requests.post(url, headers=headers, json=payload, timeout=10)
+    resp = _SESSION.post(url, headers=headers, data=orjson.dumps(payload), timeout=10)
     return 200 <= resp.status_code < 300
 
 
-def log_delivery(paths: dict[str, Path], record: dict[str, Any], status: str, detail: str | None) -> None:
+def log_delivery(
+    paths: dict[str, Path],
+    record: dict[str, Any],
+    status: str,
+    detail: str | None,
+    sent_at: str | None = None,
+) -> None:
     entry = {
         "status": status,
         "detail": detail,
-        "sent_at": utc_now(),
+        "sent_at": sent_at or utc_now(),
         "record": record,
     }
-    append_jsonl(paths["sent"], entry)
-    append_jsonl(paths["proofs"], entry)
+    line = orjson.dumps(entry) + b"\n"
+    open_sink(paths["sent"]).write(line)
+    open_sink(paths["proofs"]).write(line)
+
+
+def open_sink(path: Path) -> BinaryIO:
+    sink = _SINKS.get(path)
+    if sink is None:
+        sink = _SINKS[path] = path.open("ab", buffering=64 * 1024)
+    return sink
+
+
+def flush_sinks() -> None:
+    for sink in _SINKS.values():
+        sink.flush()
+
+
+def peek_field(line: bytes, pattern: re.Pattern[bytes]) -> str | None:
+    matches = pattern.findall(line)
+    if len(matches) != 1:
+        return None
+    try:
+        return matches[0].decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def peek_settled(
+    cfg: DispatcherConfig,
+    line: bytes,
+    contact_state: dict[str, Any],
+    config_cache: dict[str, dict[str, Any]],
+) -> bool | None:
+    """Settle already-handled records from the raw line: True to advance past it, False to hold,
+    None to parse it and run process_record."""
+    lead_id = peek_field(line, _LEAD_ID_RE)
+    if not lead_id:
+        return None
+    lead_state = contact_state.get(lead_id)
+    status = lead_state.get("status") if lead_state else None
+    if status not in _SETTLED_STATUSES and status != "held":
+        return None
+    slot_id = peek_field(line, _SLOT_ID_RE)
+    # A disabled channel rewrites the lead's state in process_record, so leave that case to it.
+    if not slot_id or not is_channel_enabled(slot_id, cfg.channel, cfg.slots_root, config_cache):
+        return None
+    return status != "held"
 
 
 def process_record(
@@ -267,16 +503,19 @@ def process_record(
     contact_state: dict[str, Any],
     rate_state: dict[str, Any],
     config_cache: dict[str, dict[str, Any]],
+    batch: list[dict[str, Any]] | None = None,
 ) -> tuple[bool, bool]:
     lead_id = record.get("lead_id")
     slot_id = record.get("slot_id") or "unknown"
+    # One timestamp per record, refreshed after a network send so "sent" times stay accurate.
+    now = utc_now()
     if not lead_id:
-        log_delivery(paths, record, "invalid", "missing lead_id")
+        log_delivery(paths, record, "invalid", "missing lead_id", now)
         return True, True
 
     if not is_channel_enabled(slot_id, cfg.channel, cfg.slots_root, config_cache):
-        contact_state[lead_id] = {"status": "skipped", "updated_at": utc_now(), "detail": "channel_disabled"}
-        log_delivery(paths, record, "skipped", "channel_disabled")
+        contact_state[lead_id] = {"status": "skipped", "updated_at": now, "detail": "channel_disabled"}
+        log_delivery(paths, record, "skipped", "channel_disabled", now)
         return True, True
 
     lead_state = contact_state.get(lead_id)
@@ -286,37 +525,41 @@ def process_record(
         return True, False
     if lead_state and lead_state.get("status") == "held":
         return False, False
+    # An earlier copy already waiting in the batch counts as sent, like a settled lead above.
+    if batch and any(item["record"].get("lead_id") == lead_id for item in batch):
+        return True, False
 
     payload = record.get("payload") or {}
-    contact = extract_contact(payload, cfg.channel)
+    contact = extract_contact(payload, cfg.contact_keys)
 
     if cfg.dry_run:
         if cfg.dry_run_advance:
-            contact_state[lead_id] = {"status": "skipped", "updated_at": utc_now(), "detail": "dry_run"}
-            log_delivery(paths, record, "skipped", "dry_run")
+            contact_state[lead_id] = {"status": "skipped", "updated_at": now, "detail": "dry_run"}
+            log_delivery(paths, record, "skipped", "dry_run", now)
             return True, True
-        contact_state[lead_id] = {"status": "held", "updated_at": utc_now(), "detail": "dry_run_hold"}
+        contact_state[lead_id] = {"status": "held", "updated_at": now, "detail": "dry_run_hold"}
         return False, True
 
-    if cfg.channel in CONTACT_KEYS and not contact:
-        contact_state[lead_id] = {"status": "blocked", "updated_at": utc_now(), "detail": "missing_contact"}
-        log_delivery(paths, record, "blocked", "missing_contact")
+    if cfg.needs_contact and not contact:
+        contact_state[lead_id] = {"status": "blocked", "updated_at": now, "detail": "missing_contact"}
+        log_delivery(paths, record, "blocked", "missing_contact", now)
         return True, True
 
-    if cfg.channel == "whatsapp" and cfg.waha_base_url and cfg.waha_session:
+    if cfg.use_waha:
         ok = send_whatsapp_waha(cfg, contact, record)
+        now = utc_now()
         if ok:
             mark_sent(rate_state, slot_id)
-            contact_state[lead_id] = {"status": "sent", "updated_at": utc_now()}
-            log_delivery(paths, record, "sent", "waha")
+            contact_state[lead_id] = {"status": "sent", "updated_at": now}
+            log_delivery(paths, record, "sent", "waha", now)
             return True, True
-        contact_state[lead_id] = {"status": "failed", "updated_at": utc_now(), "detail": "waha_error"}
-        log_delivery(paths, record, "failed", "waha_error")
+        contact_state[lead_id] = {"status": "failed", "updated_at": now, "detail": "waha_error"}
+        log_delivery(paths, record, "failed", "waha_error", now)
         return False, True
 
     if not cfg.webhook_url:
-        contact_state[lead_id] = {"status": "blocked", "updated_at": utc_now(), "detail": "missing_webhook"}
-        log_delivery(paths, record, "blocked", "missing_webhook")
+        contact_state[lead_id] = {"status": "blocked", "updated_at": now, "detail": "missing_webhook"}
+        log_delivery(paths, record, "blocked", "missing_webhook", now)
         return True, True
 
     if not can_send(rate_state, slot_id, cfg.rate_per_minute):
@@ -324,58 +567,158 @@ def process_record(
 
     payload_out = {
         "channel": cfg.channel,
-        "sent_at": utc_now(),
+        "sent_at": now,
         "record": record,
         "contact": contact,
         "message": build_message(record, cfg.channel),
     }
+    if batch is not None:
+        # Delivered later by send_batch; reserve the rate slot now so the batch respects the limit.
+        mark_sent(rate_state, slot_id)
+        batch.append(payload_out)
+        return True, False
     ok = send_webhook(cfg.webhook_url, cfg.webhook_secret, payload_out)
+    now = utc_now()
     if ok:
         mark_sent(rate_state, slot_id)
-        contact_state[lead_id] = {"status": "sent", "updated_at": utc_now()}
-        log_delivery(paths, record, "sent", None)
+        contact_state[lead_id] = {"status": "sent", "updated_at": now}
+        log_delivery(paths, record, "sent", None, now)
         return True, True
-    contact_state[lead_id] = {"status": "failed", "updated_at": utc_now(), "detail": "webhook_error"}
-    log_delivery(paths, record, "failed", "webhook_error")
+    contact_state[lead_id] = {"status": "failed", "updated_at": now, "detail": "webhook_error"}
+    log_delivery(paths, record, "failed", "webhook_error", now)
     return False, True
 
 
-def process_queue(cfg: DispatcherConfig) -> None:
+def send_batch(
+    cfg: DispatcherConfig,
+    paths: dict[str, Path],
+    batch: list[dict[str, Any]],
+    contact_state: dict[str, Any],
+    rate_state: dict[str, Any],
+    pending_log: list[dict[str, Any]],
+) -> bool:
+    ok = send_webhook(cfg.webhook_url, cfg.webhook_secret, {"channel": cfg.channel, "sent_at": utc_now(), "batch": batch})
+    now = utc_now()
+    for item in batch:
+        record = item["record"]
+        lead_id = record["lead_id"]
+        if ok:
+            contact_state[lead_id] = {"status": "sent", "updated_at": now}
+            log_delivery(paths, record, "sent", None, now)
+        else:
+            unmark_sent(rate_state, record.get("slot_id") or "unknown")
+            contact_state[lead_id] = {"status": "failed", "updated_at": now, "detail": "webhook_error"}
+            log_delivery(paths, record, "failed", "webhook_error", now)
+        pending_log.append({"lead_id": lead_id, **contact_state[lead_id]})
+    batch.clear()
+    return ok
+
+
+def flush_state(
+    paths: dict[str, Path],
+    pending_log: list[dict[str, Any]],
+    rate_dirty: bool,
+    offset: int,
+) -> None:
+    flush_sinks()
+    append_jsonl_many(paths["contact_state_log"], pending_log)
+    if rate_dirty:
+        _RATE["dirty"] = True
+    save_rate_state(paths)
+    write_offset(paths["offset"], offset)
+
+
+def process_queue(cfg: DispatcherConfig, contact_state: dict[str, Any], log_entries: int) -> tuple[int, int]:
+    """Run one poll cycle; returns the records processed and the updated change-log length."""
     paths = ensure_channel_files(cfg.runtime_root, cfg.channel)
-    contact_state = load_json(paths["contact_state"], {})
-    rate_state = load_json(paths["rate"], {})
+    rate_state = load_rate_state(paths)
     config_cache: dict[str, dict[str, Any]] = {}
-    offset = read_offset(paths["offset"])
+    offset = read_offset(paths["offset"], paths["queue"])
+    # Last offset on disk; an idle poll that leaves it unchanged writes nothing.
+    checkpoint = offset
 
     processed = 0
-    with paths["queue"].open("r", encoding="utf-8") as f:
-        for idx, line in enumerate(f):
-            if idx < offset:
+    pending_log: list[dict[str, Any]] = []
+    dirty_rate = False
+    # With DISPATCHER_WEBHOOK_BATCH_MAX > 1, webhook sends are collected and posted together; until a batch
+    # is delivered the checkpointed offset stays at its first record (batch_start).
+    batch: list[dict[str, Any]] | None = [] if cfg.webhook_batch_max > 1 else None
+    batch_start = offset
+    processed_at_batch_start = 0
+    with paths["queue"].open("rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                # The producer is mid-append; pick the line up complete on the next poll.
+                break
+            line_end = offset + len(raw)
+            if raw.isspace():
+                offset = line_end
                 continue
-            line = line.strip()
-            if not line:
-                offset = idx + 1
+            # orjson and the peek regexes both tolerate the trailing newline, so no strip copy is needed.
+            settled = peek_settled(cfg, raw, contact_state, config_cache)
+            if settled is not None:
+                if not settled:
+                    break
+                offset = line_end
+                processed += 1
                 continue
             try:
-                record = json.loads(line)
+                record = orjson.loads(raw)
             except Exception:
-                log_delivery(paths, {"raw": line}, "invalid", "json_parse_error")
-                offset = idx + 1
+                log_delivery(paths, {"raw": raw.strip().decode("utf-8", errors="replace")}, "invalid", "json_parse_error")
+                offset = line_end
                 continue
 
-            advance, mutated = process_record(cfg, paths, record, contact_state, rate_state, config_cache)
+            if not batch:
+                batch_start = offset
+                processed_at_batch_start = processed
+            advance, mutated = process_record(cfg, paths, record, contact_state, rate_state, config_cache, batch)
+            sent = False
             if mutated:
-                save_json(paths["contact_state"], contact_state)
-                save_json(paths["rate"], rate_state)
+                lead_id = record.get("lead_id")
+                if lead_id and lead_id in contact_state:
+                    pending_log.append({"lead_id": lead_id, **contact_state[lead_id]})
+                    sent = contact_state[lead_id].get("status") == "sent"
+                dirty_rate = True
             if advance:
-                offset = idx + 1
-                write_offset(paths["offset"], offset)
+                offset = line_end
                 processed += 1
-                continue
-            break
+            if batch and (len(batch) >= cfg.webhook_batch_max or not advance):
+                dirty_rate = True
+                if not send_batch(cfg, paths, batch, contact_state, rate_state, pending_log):
+                    # Rewound records were not handled, so don't report them and main backs off before retrying.
+                    offset = batch_start
+                    processed = processed_at_batch_start
+                    advance = False
+                sent = True
+            # State is written before the offset, so a crash replays records rather than losing them;
+            # flush straight after a real send so a restart cannot deliver it twice.
+            if sent or len(pending_log) >= FLUSH_EVERY:
+                checkpoint = batch_start if batch else offset
+                flush_state(paths, pending_log, dirty_rate, checkpoint)
+                log_entries += len(pending_log)
+                pending_log = []
+                dirty_rate = False
+            if not advance:
+                break
+
+    if batch:
+        dirty_rate = True
+        if not send_batch(cfg, paths, batch, contact_state, rate_state, pending_log):
+            offset = batch_start
+            processed = processed_at_batch_start
+    if pending_log or dirty_rate or offset != checkpoint:
+        flush_state(paths, pending_log, dirty_rate, offset)
+        log_entries += len(pending_log)
+    else:
+        flush_sinks()
+
+    if log_entries > max(CONTACT_LOG_COMPACT_MIN, 4 * len(contact_state)):
+        compact_contact_state(paths, contact_state)
+        log_entries = 0
 
-    if processed == 0:
-        time.sleep(cfg.poll_seconds)
+    return processed, log_entries
 
 
 def load_cfg(args: argparse.Namespace) -> DispatcherConfig:
@@ -386,6 +729,7 @@ def load_cfg(args: argparse.Namespace) -> DispatcherConfig:
     rate_per_minute = int(os.environ.get("DISPATCHER_RATE_PER_MINUTE", "6"))
     dry_run = coerce_bool(os.environ.get("DISPATCHER_DRY_RUN", "true"), default=True)
     dry_run_advance = coerce_bool(os.environ.get("DISPATCHER_DRY_RUN_ADVANCE", "false"), default=False)
+    webhook_batch_max = max(1, min(int(os.environ.get("DISPATCHER_WEBHOOK_BATCH_MAX", "1")), 64))
 
     webhook_url = os.environ.get(f"{channel.upper()}_WEBHOOK_URL") or None
     webhook_secret = os.environ.get(f"{channel.upper()}_WEBHOOK_SECRET") or None
@@ -416,6 +760,7 @@ def load_cfg(args: argparse.Namespace) -> DispatcherConfig:
         waha_chat_suffix=waha_chat_suffix,
         waha_auth_header=waha_auth_header,
         waha_auth_prefix=waha_auth_prefix,
+        webhook_batch_max=webhook_batch_max,
     )
 
 
@@ -426,14 +771,23 @@ def main() -> int:
     args = parser.parse_args()
 
     cfg = load_cfg(args)
+    paths = ensure_channel_files(cfg.runtime_root, cfg.channel)
+    watch = QueueWatch(paths["queue"])
+    # Only this process writes contact_state, so the log is replayed once and the dict kept across polls.
+    contact_state, log_entries = load_contact_state(paths)
     try:
         while True:
-            process_queue(cfg)
+            processed, log_entries = process_queue(cfg, contact_state, log_entries)
+            if processed == 0:
+                watch.wait(cfg.poll_seconds)
     except KeyboardInterrupt:
         return 0
     except Exception as exc:
         print(f"[dispatcher] fatal: {exc}", file=sys.stderr)
         return 1
+    finally:
+        flush_sinks()
+        save_rate_state(paths, force=True)
 
 
 if __name__ == "__main__":
@@ -1,21 +1,40 @@
 from __future__ import annotations
 
+import functools
 import re
-from difflib import SequenceMatcher
 from typing import Any
 
+from rapidfuzz import fuzz, process
+
 _TIME_RX = re.compile(r"\b\d+\s*(min|mins|minute|minutes|hour|hours|hr|hrs|day|days)\s*ago\b", re.IGNORECASE)
 _MEMBER_SINCE_RX = re.compile(r"member since[^\n]*", re.IGNORECASE)
 _MEMBER_MONTHS_RX = re.compile(r"member since\s+(\d+)\s*\+?\s*(month|months|year|years)", re.IGNORECASE)
-_QUANTITY_RX = re.compile(r"\bQuantity\b\s*:\s*([^\n]+)", re.IGNORECASE)
-_STRENGTH_RX = re.compile(r"\bStrength\b\s*:\s*([^\n]+)", re.IGNORECASE)
-_PACKAGING_RX = re.compile(r"\bPackaging(?:\s*(?:Size|Type))?\b\s*:\s*([^\n]+)", re.IGNORECASE)
-_INTENT_RX = re.compile(r"\bI\s+want\s+this\s+for\b\s*:\s*([^\n]+)", re.IGNORECASE)
-_BUYS_RX = re.compile(r"\bBuys\b\s*:\s*([^\n]+)", re.IGNORECASE)
-_REQUIREMENTS_RX = re.compile(r"\bRequirements\b\s*:\s*(\d+)", re.IGNORECASE)
-_CALLS_RX = re.compile(r"\bCalls\b\s*:\s*(\d+)", re.IGNORECASE)
-_REPLIES_RX = re.compile(r"\bReplies\b\s*:\s*(\d+)", re.IGNORECASE)
-_RETAIL_RX = re.compile(r"\bretail\s+lead\b", re.IGNORECASE)
+# Finds the first "N <unit> ago" and the first "member since" in one pass for extract_timing_fields. Only the
+# "member since" label is consumed, so a time phrase later on the same line is still seen.
+_TIMING_RX = re.compile(
+    r"(?P<time>\b\d+\s*(?:min|mins|minute|minutes|hour|hours|hr|hrs|day|days)\s*ago\b)|(?P<member>member since)",
+    re.IGNORECASE,
+)
+# (payload key, label, value) for extract_structured_fields. The value sits in a lookahead so a match only
+# consumes its label and a later label on the same line is still found by the same scan.
+_STRUCTURED_FIELDS = (
+    ("quantity_text", r"\bQuantity\b\s*:", r"\s*([^\n]+)"),
+    ("strength_text", r"\bStrength\b\s*:", r"\s*([^\n]+)"),
+    ("packaging_text", r"\bPackaging(?:\s*(?:Size|Type))?\b\s*:", r"\s*([^\n]+)"),
+    ("intent_text", r"\bI\s+want\s+this\s+for\b\s*:", r"\s*([^\n]+)"),
+    ("buys_text", r"\bBuys\b\s*:", r"\s*([^\n]+)"),
+    ("engagement_requirements", r"\bRequirements\b\s*:", r"\s*(\d+)"),
+    ("engagement_calls", r"\bCalls\b\s*:", r"\s*(\d+)"),
+    ("engagement_replies", r"\bReplies\b\s*:", r"\s*(\d+)"),
+)
+_STRUCTURED_INT_FIELDS = frozenset({"engagement_requirements", "engagement_calls", "engagement_replies"})
+_STRUCTURED_RX = re.compile(
+    "|".join(f"(?P<{key}>{label}(?={value}))" for key, label, value in _STRUCTURED_FIELDS)
+    + r"|(?P<retail_hint>\bretail\s+lead\b)",
+    re.IGNORECASE,
+)
+# Group number of each field's value capture, which directly follows the field's named group.
+_STRUCTURED_VALUE_GROUPS = {key: _STRUCTURED_RX.groupindex[key] + 1 for key, _, _ in _STRUCTURED_FIELDS}
 
 
 def normalize_list(value: Any) -> list[str]:
@@ -48,49 +67,90 @@ def text_contains_any(text: str, keywords: list[str]) -> bool:
     return any(k in haystack for k in keywords)
 
 
+def compile_terms(terms: list[str] | tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile literal terms into one alternation so a text is scanned once for all of them."""
+    return _compile_terms(tuple(terms))
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_terms(terms: tuple[str, ...]) -> re.Pattern[str] | None:
+    unique = [t for t in dict.fromkeys(terms) if t]
+    if not unique:
+        return None
+    return re.compile("|".join(re.escape(t) for t in unique))
+
+
 def normalize_keyword_text(value: str) -> str:
     normalized = re.sub(r"[^a-z0-9 ]+", " ", value.lower())
     return " ".join(normalized.split())
 
 
-def fuzzy_ratio(a: str, b: str) -> float:
-    return SequenceMatcher(None, a, b).ratio()
+def prepare_keywords(keywords: list[str] | tuple[str, ...]) -> tuple[tuple[str, int], ...]:
+    """Normalize rule keywords once into (normalized, token_count) pairs, dropping empty ones."""
+    return _prepare_keywords(tuple(keywords))
 
 
-def keywords_match(text: str, keywords: list[str], fuzzy_enabled: bool, fuzzy_threshold: float) -> bool:
-    normalized = normalize_keyword_text(text)
+@functools.lru_cache(maxsize=512)
+def _prepare_keywords(keywords: tuple[str, ...]) -> tuple[tuple[str, int], ...]:
+    prepared = []
+    for raw in keywords:
+        keyword = normalize_keyword_text(raw)
+        if keyword:
+            prepared.append((keyword, len(keyword.split())))
+    return tuple(prepared)
+
+
+def fuzzy_ratio(a: str, b: str, threshold: float = 0.0) -> float:
+    """Similarity in [0, 1]; returns 0.0 early when the length gap alone keeps it below `threshold`."""
+    if a == b:
+        return 1.0
+    len_a, len_b = len(a), len(b)
+    if not len_a or not len_b:
+        return 0.0
+    if 2 * min(len_a, len_b) / (len_a + len_b) < threshold:
+        return 0.0
+    return fuzz.ratio(a, b) / 100.0
+
+
+def keywords_match(
+    text: str,
+    keywords: list[str],
+    fuzzy_enabled: bool,
+    fuzzy_threshold: float,
+    pre_normalized: str | None = None,
+) -> bool:
+    normalized = pre_normalized if pre_normalized is not None else normalize_keyword_text(text)
     if not normalized:
         return False
     tokens = normalized.split()
     if not tokens:
         return False
-    for raw in keywords:
-        keyword = normalize_keyword_text(raw)
-        if not keyword:
-            continue
+    long_tokens = [token for token in tokens if len(token) >= 4]
+    # Token windows per keyword width, built once and scored against each keyword in a single call.
+    windows: dict[int, list[str]] = {}
+    for keyword, window in prepare_keywords(keywords):
         if keyword in normalized:
             return True
         if not fuzzy_enabled:
             continue
         if len(keyword) < 4:
             continue
-        keyword_tokens = keyword.split()
-        if len(keyword_tokens) == 1:
-            for token in tokens:
-                if len(token) < 4:
-                    continue
-                if fuzzy_ratio(token, keyword) >= fuzzy_threshold:
-                    return True
+        if window == 1:
+            if long_tokens and process.extractOne(
+                keyword, long_tokens, scorer=fuzz.ratio, score_cutoff=fuzzy_threshold * 100
+            ):
+                return True
             continue
-        window = len(keyword_tokens)
         if window > len(tokens):
-            if fuzzy_ratio(normalized, keyword) >= fuzzy_threshold:
+            if fuzzy_ratio(normalized, keyword, fuzzy_threshold) >= fuzzy_threshold:
                 return True
             continue
-        for idx in range(len(tokens) - window + 1):
-            window_text = " ".join(tokens[idx : idx + window])
-            if fuzzy_ratio(window_text, keyword) >= fuzzy_threshold:
-                return True
+        texts = windows.get(window)
+        if texts is None:
+            texts = [" ".join(tokens[idx : idx + window]) for idx in range(len(tokens) - window + 1)]
+            windows[window] = texts
+        if process.extractOne(keyword, texts, scorer=fuzz.ratio, score_cutoff=fuzzy_threshold * 100):
+            return True
     return False
 
 
@@ -103,29 +163,41 @@ def country_matches(value: str, terms: list[str]) -> bool:
     normalized = normalize_country_value(value)
     if not normalized:
         return False
-    tokens = {t for t in normalized.split() if t}
-    aliases = {
-        "us": ["usa", "united states", "united states of america"],
-        "usa": ["united states", "united states of america"],
-        "uk": ["united kingdom"],
-        "aus": ["australia"],
-    }
+    pattern, short_terms = compile_country_matcher(terms)
+    # Terms of up to 3 chars ("us", "uk") must match a whole token; longer terms and aliases match as substrings.
+    if short_terms and not short_terms.isdisjoint(normalized.split()):
+        return True
+    return pattern is not None and pattern.search(normalized) is not None
+
+
+_COUNTRY_ALIASES = {
+    "us": ("usa", "united states", "united states of america"),
+    "usa": ("united states", "united states of america"),
+    "uk": ("united kingdom",),
+    "aus": ("australia",),
+}
+
+
+def compile_country_matcher(terms: list[str] | tuple[str, ...]) -> tuple[re.Pattern[str] | None, frozenset[str]]:
+    """Split country terms into whole-token short terms and one substring alternation (aliases included)."""
+    return _compile_country_matcher(tuple(terms))
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_country_matcher(terms: tuple[str, ...]) -> tuple[re.Pattern[str] | None, frozenset[str]]:
+    short_terms: set[str] = set()
+    substrings: list[str] = []
     for raw in terms:
         term = normalize_country_value(raw)
         if not term:
             continue
         if len(term) <= 3:
-            if term in tokens:
-                return True
+            short_terms.add(term)
         else:
-            if term in normalized:
-                return True
-        if term in aliases:
-            for alias in aliases[term]:
-                alias_norm = normalize_country_value(alias)
-                if alias_norm and alias_norm in normalized:
-                    return True
-    return False
+            substrings.append(term)
+        substrings.extend(_COUNTRY_ALIASES.get(term, ()))
+    pattern = re.compile("|".join(re.escape(t) for t in dict.fromkeys(substrings))) if substrings else None
+    return pattern, frozenset(short_terms)
 
 
 def extract_time_text(text: str | None) -> str | None:
@@ -175,35 +247,61 @@ def parse_member_months(raw: str | None) -> int | None:
     return value
 
 
-def _extract_match(rx: re.Pattern[str], text: str) -> str | None:
-    match = rx.search(text)
-    if not match:
-        return None
-    return match.group(1).strip()
-
-
-def _extract_int(rx: re.Pattern[str], text: str) -> int | None:
-    match = rx.search(text)
-    if not match:
-        return None
-    try:
-        return int(match.group(1))
-    except Exception:
-        return None
+def extract_timing_fields(
+    text: str | None,
+    time_text: str | None = None,
+    member_since_text: str | None = None,
+) -> dict[str, Any]:
+    """time_text/age_hours/member_since_text/member_months from one scan of `text`.
+
+    Matches extract_time_text + parse_age_hours + extract_member_since_text + parse_member_months; values
+    already known (e.g. scraped separately) can be passed in and are used instead of scanning for them.
+    """
+    text = text or ""
+    time_text = time_text or None
+    member_since_text = member_since_text or None
+    if text and (time_text is None or member_since_text is None):
+        found_time: str | None = None
+        found_member: str | None = None
+        for match in _TIMING_RX.finditer(text):
+            if match.lastgroup == "time":
+                if found_time is None:
+                    found_time = match.group(0).strip()
+            elif found_member is None:
+                line_end = text.find("\n", match.start())
+                found_member = text[match.start() : line_end if line_end >= 0 else len(text)].strip()
+            if found_time is not None and found_member is not None:
+                break
+        time_text = time_text or found_time
+        member_since_text = member_since_text or found_member
+    return {
+        "time_text": time_text,
+        "age_hours": parse_age_hours(time_text or text),
+        "member_since_text": member_since_text,
+        # Without a "member since" phrase the months pattern cannot match the text either.
+        "member_months": parse_member_months(member_since_text) if member_since_text else None,
+    }
 
 
 def extract_structured_fields(text: str | None) -> dict[str, Any]:
     if not text:
         return {}
-    payload: dict[str, Any] = {
-        "quantity_text": _extract_match(_QUANTITY_RX, text),
-        "strength_text": _extract_match(_STRENGTH_RX, text),
-        "packaging_text": _extract_match(_PACKAGING_RX, text),
-        "intent_text": _extract_match(_INTENT_RX, text),
-        "buys_text": _extract_match(_BUYS_RX, text),
-        "engagement_requirements": _extract_int(_REQUIREMENTS_RX, text),
-        "engagement_calls": _extract_int(_CALLS_RX, text),
-        "engagement_replies": _extract_int(_REPLIES_RX, text),
-        "retail_hint": bool(_RETAIL_RX.search(text)),
-    }
+    payload: dict[str, Any] = {key: None for key, _, _ in _STRUCTURED_FIELDS}
+    payload["retail_hint"] = False
+    for match in _STRUCTURED_RX.finditer(text):
+        key = match.lastgroup
+        if key == "retail_hint":
+            payload[key] = True
+            continue
+        # Like a per-field search, the first occurrence wins.
+        if payload[key] is not None:
+            continue
+        value = match.group(_STRUCTURED_VALUE_GROUPS[key])
+        if key in _STRUCTURED_INT_FIELDS:
+            try:
+                payload[key] = int(value)
+            except Exception:
+                continue
+        else:
+            payload[key] = value.strip()
     return payload
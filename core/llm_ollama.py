@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import functools
 import os
+from dataclasses import dataclass
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Ollama usually runs on localhost; reuse the connection instead of reconnecting per message.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
 
 
 def _coerce_bool(value: Any, default: bool = False) -> bool:
@@ -50,45 +58,67 @@ def _format_details(record: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def generate_message(record: dict[str, Any], channel: str) -> str | None:
-    enabled = _coerce_bool(os.environ.get("OLLAMA_ENABLED", "false"), default=False)
-    if not enabled:
-        return None
-    allowed_channels = _normalize_list(os.environ.get("OLLAMA_CHANNELS", ""))
-    if allowed_channels and channel.lower() not in allowed_channels:
-        return None
+@dataclass(frozen=True)
+class OllamaConfig:
+    enabled: bool
+    channels: tuple[str, ...]
+    base_url: str
+    model: str
+    temperature: float
+    timeout: float
+    max_chars: int
+    prompt_prefix: str
+    # The user prompt template split on "{details}", re-joined with each lead's details.
+    template_parts: tuple[str, ...]
 
-    base_url = (os.environ.get("OLLAMA_BASE_URL") or "http://localhost:11434").rstrip("/")
-    model = os.environ.get("OLLAMA_MODEL") or "llama3.1"
-    temperature = float(os.environ.get("OLLAMA_TEMPERATURE", "0.4"))
-    timeout = float(os.environ.get("OLLAMA_TIMEOUT_SECONDS", "12"))
-    max_chars = int(float(os.environ.get("OLLAMA_MAX_CHARS", "480")))
 
+@functools.lru_cache(maxsize=1)
+def _ollama_config() -> OllamaConfig:
+    # OLLAMA_* is fixed for the life of a worker process, so it is read and parsed once.
     system_prompt = os.environ.get(
         "OLLAMA_SYSTEM_PROMPT",
         "You are a concise, professional sales representative. Use only the provided facts.",
     )
-    details = _format_details(record)
-    user_prompt = os.environ.get(
+    template = os.environ.get(
         "OLLAMA_PROMPT_TEMPLATE",
         "Write a short WhatsApp-style message (2-4 lines). "
         "Do not invent facts. Use only these details:\n{details}",
-    ).replace("{details}", details)
+    )
+    return OllamaConfig(
+        enabled=_coerce_bool(os.environ.get("OLLAMA_ENABLED", "false"), default=False),
+        channels=tuple(_normalize_list(os.environ.get("OLLAMA_CHANNELS", ""))),
+        base_url=(os.environ.get("OLLAMA_BASE_URL") or "http://localhost:11434").rstrip("/"),
+        model=os.environ.get("OLLAMA_MODEL") or "llama3.1",
+        temperature=float(os.environ.get("OLLAMA_TEMPERATURE", "0.4")),
+        timeout=float(os.environ.get("OLLAMA_TIMEOUT_SECONDS", "12")),
+        max_chars=int(float(os.environ.get("OLLAMA_MAX_CHARS", "480"))),
+        prompt_prefix=f"{system_prompt}\n\n",
+        template_parts=tuple(template.split("{details}")),
+    )
 
+
+def generate_message(record: dict[str, Any], channel: str) -> str | None:
+    cfg = _ollama_config()
+    if not cfg.enabled:
+        return None
+    if cfg.channels and channel.lower() not in cfg.channels:
+        return None
+
+    details = _format_details(record)
     payload = {
-        "model": model,
-        "prompt": f"{system_prompt}\n\n{user_prompt}",
+        "model": cfg.model,
+        "prompt": cfg.prompt_prefix + details.join(cfg.template_parts),
         "stream": False,
-        "options": {"temperature": temperature},
+        "options": {"temperature": cfg.temperature},
     }
     try:
-        resp = requests.post(f"{base_url}/api/generate", json=payload, timeout=timeout)
+        resp = _SESSION.post(f"{cfg.base_url}/api/generate", json=payload, timeout=cfg.timeout)
         if not (200 <= resp.status_code < 300):
             return None
         data = resp.json()
         text = (data.get("response") or "").strip()
         if not text:
             return None
-        return text[:max_chars]
+        return text[: cfg.max_chars]
     except Exception:
         return None
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-import json
+import atexit
+import os
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+# Keep-alive pool for the verified-event webhook, shared by every request handled in this process.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 
 def utc_now() -> str:
@@ -12,24 +23,90 @@ def utc_now() -> str:
 
 
 def append_jsonl(path: Path, record: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record) + "\n")
+    _append_bytes(path, orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+
+
+def append_jsonl_many(path: Path, records: list[dict[str, Any]]) -> None:
+    if not records:
+        return
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    _append_bytes(path, b"".join(orjson.dumps(record, option=option) for record in records))
+
+
+@dataclass
+class _AppendFile:
+    fd: int = -1
+    ino: int | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# path -> O_APPEND descriptor kept open for the life of the process.
+_APPEND_FILES: dict[str, _AppendFile] = {}
+_APPEND_FILES_LOCK = threading.Lock()
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    key = str(path)
+    entry = _APPEND_FILES.get(key)
+    if entry is None:
+        with _APPEND_FILES_LOCK:
+            entry = _APPEND_FILES.setdefault(key, _AppendFile())
+    # Writers to the same path hold its lock, so a stale descriptor can be closed safely on rotation.
+    with entry.lock:
+        # An O_APPEND fd never fails once its file is unlinked, so the stat is what notices a removed or
+        # replaced file; it still costs less than the open/close it replaces.
+        try:
+            current_ino = os.stat(key).st_ino
+        except FileNotFoundError:
+            current_ino = None
+        if entry.fd < 0 or entry.ino != current_ino:
+            if entry.fd >= 0:
+                os.close(entry.fd)
+                entry.fd = -1
+            path.parent.mkdir(parents=True, exist_ok=True)
+            entry.fd = os.open(key, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            entry.ino = os.fstat(entry.fd).st_ino
+        # O_APPEND makes each write land at the current end of file, even with other writers.
+        view = memoryview(data)
+        while view:
+            view = view[os.write(entry.fd, view) :]
+
+
+@atexit.register
+def _close_append_fds() -> None:
+    with _APPEND_FILES_LOCK:
+        for entry in _APPEND_FILES.values():
+            with entry.lock:
+                if entry.fd >= 0:
+                    os.close(entry.fd)
+                    entry.fd = -1
+        _APPEND_FILES.clear()
 
 
 def init_queue_files(runtime_root: Path, names: list[str]) -> None:
+    # Only the first call per (root, names) touches the filesystem; later events skip straight to appending.
+    key = (str(runtime_root), tuple(names))
+    if key in _INITIALIZED_QUEUES:
+        return
     runtime_root.mkdir(parents=True, exist_ok=True)
     for name in names:
         (runtime_root / f"{name}_queue.jsonl").touch(exist_ok=True)
         (runtime_root / f"{name}_queue.offset").touch(exist_ok=True)
+    _INITIALIZED_QUEUES.add(key)
+
+
+_INITIALIZED_QUEUES: set[tuple[str, tuple[str, ...]]] = set()
 
 
 def fan_out_verified(record: dict[str, Any], runtime_root: Path) -> None:
     """Append verified event to all channel queues."""
     channels = ["whatsapp", "telegram", "email", "sheets", "push", "slack"]
     init_queue_files(runtime_root, channels + ["verified"])
+    base = {k: v for k, v in record.items() if k != "channel"}
+    # Serialize once and splice each channel name in before the closing brace.
+    head = orjson.dumps(base, option=orjson.OPT_NON_STR_KEYS)[:-1] + (b',"channel":"' if base else b'"channel":"')
     for name in channels:
-        append_jsonl(runtime_root / f"{name}_queue.jsonl", {**record, "channel": name})
+        _append_bytes(runtime_root / f"{name}_queue.jsonl", head + name.encode() + b'"}\n')
     append_jsonl(runtime_root / "verified_queue.jsonl", record)
 
 
@@ -38,7 +115,7 @@ def post_webhook(url: str, secret: str | None, payload: dict[str, Any]) -> None:
     if secret:
         headers["X-Engyne-Webhook-Secret"] = secret
     try:
-        requests.post(url, headers=headers, json=payload, timeout=5)
+        _SESSION.post(url, headers=headers, json=payload, timeout=5)
     except Exception:
         # Webhook failures should not crash event ingestion
         pass
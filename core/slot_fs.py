@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import json
+import copy
+import functools
+import os
 import re
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
+import orjson
 import yaml
 
 SLOT_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]+$")
+# libyaml's C loader when PyYAML was built with it; same safe subset, several times faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 @dataclass(frozen=True)
@@ -78,31 +83,46 @@ def list_slot_paths(slots_root: Path) -> list[SlotPaths]:
 
 
 def _read_json(path: Path) -> dict[str, Any] | None:
-    if not path.exists():
-        return None
+    # Not memoized: state/status are rewritten on every heartbeat, and orjson is cheaper than a deepcopy.
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(path.read_bytes())
     except Exception:
         return None
 
 
 def _read_yaml(path: Path) -> dict[str, Any] | None:
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return None
+    return copy.deepcopy(_read_yaml_cached(str(path), st.st_ino, st.st_mtime_ns, st.st_size))
+
+
+def _load_yaml(path: Path) -> dict[str, Any] | None:
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            if isinstance(data, dict):
-                return data
+        data = yaml.load(path.read_bytes(), Loader=_YAML_LOADER)
+        if isinstance(data, dict):
+            return data
     except Exception:
         return None
     return None
 
 
 def read_slot_config(path: Path) -> dict[str, Any]:
-    data = _read_yaml(path)
-    return data if isinstance(data, dict) else {}
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    data = _read_yaml_cached(str(path), st.st_ino, st.st_mtime_ns, st.st_size)
+    # Callers mutate the config they get back, so never hand out the cached dict itself.
+    return copy.deepcopy(data) if isinstance(data, dict) else {}
+
+
+# The inode is part of the key because every writer here replaces files via tmp + rename: a same-size
+# rewrite inside the filesystem's mtime granularity still gets a new inode.
+@functools.lru_cache(maxsize=256)
+def _read_yaml_cached(path: str, ino: int, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    return _load_yaml(Path(path))
 
 
 def write_slot_config(path: Path, data: dict[str, Any]) -> None:
@@ -115,16 +135,39 @@ def write_slot_config(path: Path, data: dict[str, Any]) -> None:
 def _count_lines(path: Path) -> int | None:
     if not path.exists():
         return None
+    return _load_line_count(path)
+
+
+def _load_line_count(path: Path) -> int | None:
+    # leads.jsonl is append-only, so only the bytes added since the last call are scanned; a shrunk or
+    # replaced file (different inode) is recounted from the start.
     try:
-        count = 0
-        with path.open("r", encoding="utf-8") as f:
-            for count, _ in enumerate(f, start=1):
-                pass
-        return count
+        st = path.stat()
+        key = str(path)
+        cached = _LINE_COUNTS.get(key)
+        if cached is not None and cached[0] == st.st_ino and cached[1] <= st.st_size:
+            _, start, newlines, last = cached
+        else:
+            start, newlines, last = 0, 0, b"\n"
+        if start < st.st_size:
+            with path.open("rb") as f:
+                f.seek(start)
+                remaining = st.st_size - start
+                while remaining > 0 and (chunk := f.read(min(1 << 20, remaining))):
+                    newlines += chunk.count(b"\n")
+                    last = chunk[-1:]
+                    remaining -= len(chunk)
+            _LINE_COUNTS[key] = (st.st_ino, st.st_size - remaining, newlines, last)
+        # A final line without a trailing newline still counts.
+        return newlines if last == b"\n" else newlines + 1
     except Exception:
         return None
 
 
+# path -> (inode, bytes scanned, newline count, last byte scanned) for _load_line_count.
+_LINE_COUNTS: dict[str, tuple[int, int, int, bytes]] = {}
+
+
 def _parse_dt(value: Any) -> datetime | None:
     if value is None:
         return None
@@ -179,12 +222,47 @@ def _extract_phase(state: dict[str, Any] | None, status: dict[str, Any] | None)
     return None
 
 
-def read_slot_snapshot(paths: SlotPaths) -> SlotSnapshot:
-    config = _read_yaml(paths.config_path)
+def read_slot_snapshot(paths: SlotPaths, preloaded_config: dict[str, Any] | None = None) -> SlotSnapshot:
+    # Callers that just wrote the config can pass it in to skip re-reading it.
+    config = preloaded_config if preloaded_config is not None else _read_yaml(paths.config_path)
     state = _read_json(paths.state_path)
     status = _read_json(paths.status_path)
     leads_count = _count_lines(paths.leads_path)
+    return _build_snapshot(paths, config, state, status, leads_count)
+
 
+def _list_names(root: Path) -> frozenset[str]:
+    try:
+        with os.scandir(root) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _read_listed_snapshot(paths: SlotPaths) -> SlotSnapshot:
+    names = _list_names(paths.root)
+    config = _read_yaml(paths.config_path) if paths.config_path.name in names else None
+    state = _read_json(paths.state_path) if paths.state_path.name in names else None
+    status = _read_json(paths.status_path) if paths.status_path.name in names else None
+    leads_count = _load_line_count(paths.leads_path) if paths.leads_path.name in names else None
+    return _build_snapshot(paths, config, state, status, leads_count)
+
+
+def read_slot_snapshot_bulk(paths: list[SlotPaths], max_workers: int = 1) -> list[SlotSnapshot]:
+    """Read snapshots for many slots, listing each slot dir once instead of stat-ing every file."""
+    if max_workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+            return list(pool.map(_read_listed_snapshot, paths))
+    return [_read_listed_snapshot(p) for p in paths]
+
+
+def _build_snapshot(
+    paths: SlotPaths,
+    config: dict[str, Any] | None,
+    state: dict[str, Any] | None,
+    status: dict[str, Any] | None,
+    leads_count: int | None,
+) -> SlotSnapshot:
     heartbeat_ts = _extract_heartbeat(state, status)
     pid = _extract_pid(state, status)
     phase = _extract_phase(state, status)
@@ -208,25 +286,58 @@ def read_slot_snapshot(paths: SlotPaths) -> SlotSnapshot:
     )
 
 
-def read_leads_tail(path: Path, limit: int = 200, verified_only: bool = False) -> list[dict[str, Any]]:
+def _iter_lines_reversed(f: Any, block_size: int = 64 * 1024) -> Iterator[bytes]:
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    tail = b""
+    while pos > 0:
+        step = min(block_size, pos)
+        pos -= step
+        f.seek(pos)
+        lines = (f.read(step) + tail).split(b"\n")
+        tail = lines[0]
+        yield from reversed(lines[1:])
+    yield tail
+
+
+def read_leads_tail(
+    path: Path,
+    limit: int = 200,
+    verified_only: bool = False,
+    predicate: Callable[[dict[str, Any]], bool] | None = None,
+    scan_limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Return the last `limit` matching records, reading the file backwards so we stop once we have them.
+
+    `scan_limit` caps how many records (before `predicate`) are looked at from the end of the file.
+    """
     if limit <= 0 or not path.exists():
         return []
-    items: deque[dict[str, Any]] = deque(maxlen=limit)
+    items: list[dict[str, Any]] = []
+    scanned = 0
     try:
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
+        with path.open("rb") as f:
+            for line in _iter_lines_reversed(f):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    record = json.loads(line)
+                    record = orjson.loads(line)
                 except Exception:
                     continue
                 if not isinstance(record, dict):
                     continue
                 if verified_only and not record.get("verified"):
                     continue
+                if scan_limit is not None and scanned >= scan_limit:
+                    break
+                scanned += 1
+                if predicate is not None and not predicate(record):
+                    continue
                 items.append(record)
+                if len(items) >= limit:
+                    break
     except Exception:
         return []
-    return list(items)
+    items.reverse()
+    return items
@@ -14,7 +14,7 @@ import json
 import os
 
 from core.alerts import send_slack_alert
-from core.slot_fs import SlotSnapshot, ensure_slots_root, list_slot_paths, read_slot_config, read_slot_snapshot, validate_slot_id
+from core.slot_fs import SlotPaths, SlotSnapshot, ensure_slots_root, list_slot_paths, read_slot_config, read_slot_snapshot, validate_slot_id
 
 HEARTBEAT_TTL_SECONDS_DEFAULT = 30
 SCAN_INTERVAL_SECONDS = 3
@@ -22,6 +22,21 @@ MIN_RESTART_INTERVAL_SECONDS = 5
 RUN_META_FILENAME = "run_meta.json"
 
 
+def _pid_alive(pid: int) -> bool:
+    # Signal 0 only checks the pid: one syscall instead of psutil's lookup. On Windows signal 0 would send
+    # CTRL_C_EVENT, so keep psutil there.
+    if os.name == "nt":
+        return psutil.pid_exists(pid)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists, but owned by another user.
+        return True
+    return True
+
+
 @dataclass
 class ManagedSlot:
     slot_id: str
@@ -65,11 +80,13 @@ class SlotManager:
         except Exception:
             self.alert_throttle_seconds = 300.0
 
-    def scan_slots(self) -> None:
-        """Discover slot directories and register them."""
-        for paths in list_slot_paths(self.slots_root):
-            if paths.slot_id not in self.slots:
-                self.slots[paths.slot_id] = ManagedSlot(slot_id=paths.slot_id)
+    def scan_slots(self) -> Dict[str, SlotPaths]:
+        """Discover slot directories, register them, and return their paths by slot id."""
+        paths_by_id = {paths.slot_id: paths for paths in list_slot_paths(self.slots_root)}
+        for slot_id in paths_by_id:
+            if slot_id not in self.slots:
+                self.slots[slot_id] = ManagedSlot(slot_id=slot_id)
+        return paths_by_id
 
     def _runner_cmd(self, slot_id: str, run_id: str) -> list[str]:
         runner_path = Path(__file__).parent / "slot_runner.py"
@@ -201,24 +218,30 @@ class SlotManager:
         managed.last_stop_ts = datetime.now(timezone.utc)
         managed.process = None
 
-    def update_snapshot(self, slot_id: str) -> None:
-        try:
-            paths = next(p for p in list_slot_paths(self.slots_root) if p.slot_id == slot_id)
-        except StopIteration:
-            return
+    def update_snapshot(self, slot_id: str, paths: Optional[SlotPaths] = None) -> None:
+        if paths is None:
+            try:
+                paths = next(p for p in list_slot_paths(self.slots_root) if p.slot_id == slot_id)
+            except StopIteration:
+                return
         snapshot = read_slot_snapshot(paths)
         managed = self.slots.setdefault(slot_id, ManagedSlot(slot_id=slot_id))
         managed.last_snapshot = snapshot
         managed.pid_alive = None
         if snapshot.pid:
             try:
-                managed.pid_alive = psutil.pid_exists(snapshot.pid)
+                managed.pid_alive = _pid_alive(snapshot.pid)
             except Exception:
                 managed.pid_alive = None
 
-    def refresh_snapshots(self) -> None:
+    def refresh_snapshots(self, paths_by_id: Optional[Dict[str, SlotPaths]] = None) -> None:
+        # One directory listing per refresh; tick passes the one scan_slots already made.
+        if paths_by_id is None:
+            paths_by_id = {p.slot_id: p for p in list_slot_paths(self.slots_root)}
         for slot_id in list(self.slots.keys()):
-            self.update_snapshot(slot_id)
+            paths = paths_by_id.get(slot_id)
+            if paths is not None:
+                self.update_snapshot(slot_id, paths)
 
     def enforce_heartbeat(self) -> None:
         now = datetime.now(timezone.utc)
@@ -290,8 +313,8 @@ class SlotManager:
                 self.stop_slot(managed.slot_id, force=True)
 
     def tick(self) -> None:
-        self.scan_slots()
-        self.refresh_snapshots()
+        paths_by_id = self.scan_slots()
+        self.refresh_snapshots(paths_by_id)
         self.enforce_run_limits()
         self.enforce_heartbeat()
 
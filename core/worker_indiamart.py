@@ -18,15 +18,12 @@ from core.queues import append_jsonl
 from core.quality import quality_mapping
 from core.lead_rules import (
     country_matches,
-    extract_member_since_text,
     extract_structured_fields,
-    extract_time_text,
+    extract_timing_fields,
     keywords_match,
     normalize_list,
     normalize_method,
     normalize_keyword_text,
-    parse_age_hours,
-    parse_member_months,
     text_contains_any,
 )
 
@@ -79,7 +76,7 @@ def read_slot_config(path: Path) -> dict:
     try:
         import yaml
 
-        data = yaml.safe_load(path.read_text())
+        data = yaml.load(path.read_bytes(), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
         return data if isinstance(data, dict) else {}
     except Exception:
         return {}
@@ -776,10 +773,11 @@ async def worker_main(cfg: WorkerConfig) -> int:
                         availability = {
                             normalize_method(str(v)) for v in (lead.get("availability") or []) if str(v).strip()
                         }
-                        time_text = lead.get("time_text") or extract_time_text(text_blob)
-                        age_hours = lead.get("age_hours") or parse_age_hours(time_text or text_blob)
-                        member_since_text = lead.get("member_since_text") or extract_member_since_text(text_blob)
-                        member_months = lead.get("member_months") or parse_member_months(member_since_text or text_blob)
+                        timing = extract_timing_fields(text_blob, lead.get("time_text"), lead.get("member_since_text"))
+                        time_text = timing["time_text"]
+                        age_hours = lead.get("age_hours") or timing["age_hours"]
+                        member_since_text = timing["member_since_text"]
+                        member_months = lead.get("member_months") or timing["member_months"]
                         structured = extract_structured_fields(text_blob)
                         category_text = lead.get("category_text")
 
@@ -818,17 +816,20 @@ async def worker_main(cfg: WorkerConfig) -> int:
                                 text_blob,
                             ]
                         )
+                        normalized_text = (
+                            normalize_keyword_text(text_for_keywords) if keywords or keywords_exclude else ""
+                        )
                         if keep and keywords:
                             if not keywords_match(
                                 text_for_keywords,
                                 keywords,
                                 fuzzy_enabled=keyword_fuzzy,
                                 fuzzy_threshold=keyword_fuzzy_threshold,
+                                pre_normalized=normalized_text,
                             ):
                                 keep = False
                                 reject_reason = "keywords"
                         if keep and keywords_exclude:
-                            normalized_text = normalize_keyword_text(text_for_keywords)
                             if text_contains_any(normalized_text, keywords_exclude):
                                 keep = False
                                 reject_reason = "keywords_exclude"